@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Towers of Hanoi Visualization - Renderer Benchmark
+
+Steps through the classic solution with each renderer backend at several
+disk counts and window sizes and prints the time per move together with
+the paint timings. Runs on Qt's offscreen platform by default.
+
+Usage:
+    python benchmark.py                          # default matrix
+    python benchmark.py --moves 500 --disks 3 10 20
+    python benchmark.py --backends scene --sizes 1920x1080
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def parse_size(text):
+    width, _, height = text.partition('x')
+    return int(width), int(height)
+
+
+def run(app, window_class, backend, num_disks, size, moves):
+    """Step one window through up to moves moves; return the figures"""
+    window = window_class(num_disks, 'classic', 'indexed')
+    widget = window.hanoi_widget
+    # Forward steps never hit the frame cache, keep it out of the figures
+    widget.set_frame_cache_budget(0)
+    widget.set_backend(backend)
+    window.resize(*size)
+    window.show()
+    app.processEvents()
+    
+    moves = min(moves, widget.solver.total_moves)
+    widget.frame_stats.reset()
+    start = time.perf_counter()
+    for _ in range(moves):
+        widget.next_move()
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    stats = widget.frame_stats.summary()
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return moves, elapsed, stats
+
+
+def main():
+    """Compare the renderer backends and print one row per configuration"""
+    parser = argparse.ArgumentParser(description="Compare the Hanoi renderer backends")
+    parser.add_argument("--moves", type=int, default=300,
+                        help="moves stepped per configuration")
+    parser.add_argument("--disks", type=int, nargs='+', default=[3, 8, 16],
+                        help="disk counts to try")
+    parser.add_argument("--sizes", type=parse_size, nargs='+',
+                        default=[(800, 600), (1200, 800), (1920, 1080)],
+                        help="window sizes to try, as WIDTHxHEIGHT")
+    parser.add_argument("--backends", nargs='+', choices=("painter", "scene"),
+                        default=["painter", "scene"], help="renderer backends to try")
+    args = parser.parse_args()
+    
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    
+    from PySide6.QtWidgets import QApplication
+    from ui.main_window import HanoiMainWindow
+    
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("Towers of Hanoi")
+    app.setOrganizationName("Educational Software")
+    
+    print(f"{'backend':<8} {'disks':>5} {'window':>10} {'moves':>6} "
+          f"{'ms/move':>8} {'frames':>6} {'paint ms':>9} {'p95 ms':>7}")
+    for size in args.sizes:
+        for num_disks in args.disks:
+            for backend in args.backends:
+                moves, elapsed, stats = run(app, HanoiMainWindow, backend,
+                                            num_disks, size, args.moves)
+                print(f"{backend:<8} {num_disks:>5} {size[0]:>5}x{size[1]:<4} {moves:>6} "
+                      f"{elapsed * 1000 / max(moves, 1):>8.3f} {stats['frames']:>6} "
+                      f"{stats['mean_ms']:>9.3f} {stats['p95_ms']:>7.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,59 @@
+import sys
+import time
+import weakref
+
+
 class Tower:
     def __init__(self, name):
         self.name = name
         self.disks = []
-    
+        
     def push(self, disk):
         self.disks.append(disk)
-    
+        
     def pop(self):
         return self.disks.pop()
 
+class SolverObserver:
+    """Receives the events of HanoiSolver.solve().
+    
+    Override only the hooks you need: hooks left as they are here are never
+    called, and with no hooks at all solve() runs the untraced recursion.
+    """
+    
+    def on_call_enter(self, n, source, target, auxiliary):
+        """A call of _move_disks starts"""
+        
+    def on_move(self, source, target, disk):
+        """A disk has just been moved"""
+        
+    def on_call_exit(self, n, source, target, auxiliary):
+        """A call of _move_disks returns"""
+
+
+HOOKS = ('on_call_enter', 'on_move', 'on_call_exit')
+
+
 class HanoiSolver:
+    """Classic rules: any top disk may move onto a larger disk or empty peg.
+    
+    Besides the eager solve(), moves can be read without building the move
+    list: move_at(i) and state_at(i) are closed-form, iter_moves() streams.
+    """
+    variant = 'classic'
+    mode = 'indexed'
+    
+    # Shown in the code panel: (line, is_keyword)
+    SOURCE_LINES = [
+        ("def _move_disks(self, n, source, target, auxiliary):", True),
+        ("    if n > 0:", True),
+        ("        self._move_disks(n-1, source, auxiliary, target)", False),
+        ("        disk = self.towers[source].pop()", False),
+        ("        self.towers[target].push(disk)", False),
+        ("        self.moves.append((source, target, disk))", False),
+        ("        self._move_disks(n-1, auxiliary, target, source)", False),
+    ]
+    
     def __init__(self, num_disks):
         self.num_disks = num_disks
         self.moves = []
@@ -21,16 +65,29 @@ class HanoiSolver:
         # Initialize tower A with disks
         for size in range(num_disks, 0, -1):
             self.towers['A'].push(size)
-        self.call_stack = []
-        self.call_stack_history = []
-    
+        self.observers = []
+        
+    def subscribe(self, observer):
+        """Have observer's hooks called by the next solve()"""
+        self.observers.append(observer)
+        
+    def unsubscribe(self, observer):
+        self.observers.remove(observer)
+        
+    def _hooks(self, name):
+        """Bound hooks of every observer that overrides name"""
+        default = getattr(SolverObserver, name)
+        return [getattr(observer, name) for observer in self.observers
+                if getattr(type(observer), name, default) is not default]
+                
     def solve(self):
-        self._move_disks(self.num_disks, 'A', 'C', 'B')
-    
+        enters, moves, exits = (self._hooks(name) for name in HOOKS)
+        if enters or moves or exits:
+            self._move_disks_traced(self.num_disks, 'A', 'C', 'B', enters, moves, exits)
+        else:
+            self._move_disks(self.num_disks, 'A', 'C', 'B')
+            
     def _move_disks(self, n, source, target, auxiliary):
-        self.call_stack.append(f"move({n}, {source}, {target}, {auxiliary})")
-        self.call_stack_history.append(list(self.call_stack))
-
         if n > 0:
             # Move n-1 disks from source to auxiliary
             self._move_disks(n-1, source, auxiliary, target)
@@ -42,5 +99,576 @@ class HanoiSolver:
             
             # Move the n-1 disks from auxiliary to target
             self._move_disks(n-1, auxiliary, target, source)
+            
+    def _move_disks_traced(self, n, source, target, auxiliary, enters, moves, exits):
+        """_move_disks with observer hooks, used only while some are attached"""
+        for hook in enters:
+            hook(n, source, target, auxiliary)
+        if n > 0:
+            self._move_disks_traced(n-1, source, auxiliary, target, enters, moves, exits)
+            disk = self.towers[source].pop()
+            self.towers[target].push(disk)
+            self.moves.append((source, target, disk))
+            for hook in moves:
+                hook(source, target, disk)
+            self._move_disks_traced(n-1, auxiliary, target, source, enters, moves, exits)
+        for hook in exits:
+            hook(n, source, target, auxiliary)
+            
+    @property
+    def total_moves(self):
+        """Length of the optimal solution, 2^n - 1"""
+        return (1 << self.num_disks) - 1
+        
+    # Rules used by manual play. Static here so the classic rules can be
+    # used without a solver instance.
+    
+    @staticmethod
+    def allows(source, target):
+        """Whether the rules allow a move from source to target at all"""
+        return source != target
+        
+    @staticmethod
+    def route(source, target):
+        """Pegs a disk passes through on its way from source to target"""
+        return (source, target)
+        
+    @staticmethod
+    def tower_moves(n, source, target):
+        """Minimum moves to carry a tower of n disks from source to target"""
+        return (1 << n) - 1 if source != target else 0
+        
+    def move_at(self, index):
+        """Return the (source, target, disk) of move number index (0-based)"""
+        if not 0 <= index < self.total_moves:
+            raise IndexError(index)
+        if index < len(self.moves):
+            return self.moves[index]
+        # Move m moves disk tz(m) + 1 between pegs (m & m-1) % 3 and
+        # ((m | m-1) + 1) % 3; pegs 1 and 2 swap roles for even n
+        m = index + 1
+        pegs = ('A', 'B', 'C') if self.num_disks % 2 else ('A', 'C', 'B')
+        return (pegs[(m & (m - 1)) % 3], pegs[((m | (m - 1)) + 1) % 3],
+                (m & -m).bit_length())
+                
+    def iter_moves(self, start=0):
+        """Yield the moves from index start onwards without storing them"""
+        for index in range(start, self.total_moves):
+            yield self.move_at(index)
+            
+    def state_at(self, index):
+        """Return the peg of every disk after index moves, in O(n)"""
+        positions = [None] * self.num_disks
+        source, target, auxiliary = 'A', 'C', 'B'
+        for n in range(self.num_disks, 0, -1):
+            half = 1 << (n - 1)
+            if index < half:
+                positions[n - 1] = source
+                target, auxiliary = auxiliary, target
+            else:
+                positions[n - 1] = target
+                index -= half
+                source, auxiliary = auxiliary, source
+        return positions
+        
+    def call_stack_at(self, index):
+        """Return the calls active while move index is made, outermost
+        first, as (n, source, target, auxiliary) tuples; empty once solved"""
+        frames = []
+        if not 0 <= index < self.total_moves:
+            return frames
+        n, source, target, auxiliary = self.num_disks, 'A', 'C', 'B'
+        while True:
+            frames.append((n, source, target, auxiliary))
+            half = 1 << (n - 1)
+            if index == half - 1:
+                return frames
+            if index < half:
+                target, auxiliary = auxiliary, target
+            else:
+                index -= half
+                source, auxiliary = auxiliary, source
+            n -= 1
+            
+    @staticmethod
+    def format_frame(frame):
+        """Return the text of one call stack frame"""
+        return "move({}, {}, {}, {})".format(*frame)
+        
+    def disk_move_counts(self, start, stop):
+        """Return how often each disk (index disk - 1) moves in [start, stop).
+        
+        Disk d makes every 2^d-th move starting at move 2^(d-1), so its
+        count among the first k moves is (k + 2^(d-1)) >> d: O(n) per query.
+        """
+        return [self.disk_move_count(disk, start, stop)
+                for disk in range(1, self.num_disks + 1)]
+                
+    def disk_move_count(self, disk, start, stop):
+        """Return how often disk moves in [start, stop)"""
+        half = 1 << (disk - 1)
+        # Clamped to the solution, like the recursive engines
+        start = min(max(start, 0), self.total_moves)
+        stop = min(max(stop, 0), self.total_moves)
+        return ((stop + half) >> disk) - ((start + half) >> disk)
+        
+    def peg_traffic(self, source, target, start, stop):
+        """Return how many moves in [start, stop) go from source to target.
+        
+        Every disk cycles through the pegs in a fixed direction (A->C->B
+        when n - d is even, A->B->C otherwise), so its t-th move is known
+        from t mod 3 and the count is arithmetic on the per-disk counts.
+        """
+        # Unknown pegs raise ValueError, as in the recursive engines
+        PEGS.index(source), PEGS.index(target)
+        total = 0
+        for disk in range(1, self.num_disks + 1):
+            cycle = 'ACB' if (self.num_disks - disk) % 2 == 0 else 'ABC'
+            step = cycle.index(source)
+            if cycle[(step + 1) % 3] != target or source == target:
+                continue
+            first = self.disk_move_count(disk, 0, start)
+            last = self.disk_move_count(disk, 0, stop)
+            # Moves t in [first, last) with t = step (mod 3)
+            total += (last - step + 2) // 3 - (first - step + 2) // 3
+        return total
+
+
+PEGS = ('A', 'B', 'C')
+
+
+def initial_towers(num_disks):
+    """Return a fresh set of towers with every disk stacked on A"""
+    towers = {name: Tower(name) for name in PEGS}
+    for size in range(num_disks, 0, -1):
+        towers['A'].push(size)
+    return towers
+
+
+# How a solution is held while it is played:
+#   eager     - solved up front, every move stored (classic only)
+#   streaming - nothing stored, played forward from iter_moves()
+#   indexed   - nothing stored, every move read with move_at()
+MODES = ('eager', 'streaming', 'indexed')
+
+
+# Solutions handed out by get_solution(), kept only while some viewer holds
+# them so that a new game releases the moves of the last one
+_solutions = weakref.WeakValueDictionary()
+
+
+def get_solution(num_disks, variant='classic', mode='eager'):
+    """Return a solver, shared between every caller asking for the same disk
+    count, variant and mode while any of them still holds it. Eager classic
+    solutions are solved up front and store the moves only; call_stack_at()
+    rebuilds the call stack at any move in every mode. The variant engines
+    are never expanded into a list, so they are always indexed or streaming.
+    Treat the result as read-only: viewers keep their own towers."""
+    key = (num_disks, variant, mode)
+    solver = _solutions.get(key)
+    if solver is None:
+        solver = SOLVERS[variant](num_disks)
+        solver.mode = 'indexed' if mode == 'eager' and variant != 'classic' else mode
+        if solver.mode == 'eager':
+            solver.solve()
+        _solutions[key] = solver
+    return solver
+
+
+def disk_positions(towers, num_disks):
+    """Return a list mapping each disk (index disk - 1) to the peg it sits on"""
+    positions = [None] * num_disks
+    for name, tower in towers.items():
+        for disk in tower.disks:
+            positions[disk - 1] = name
+    return positions
+
+
+def _third_peg(first, second):
+    """Return the peg that is neither first nor second"""
+    for peg in PEGS:
+        if peg != first and peg != second:
+            return peg
+
+
+def moves_to_goal(positions, target='C', solver=HanoiSolver):
+    """Minimum number of moves to gather every disk on target under the
+    rules of solver (classic by default).
+    
+    Works for any legal configuration in O(n): walking from the largest disk
+    down, a disk already on the current target costs nothing. Otherwise it
+    follows its route hop by hop; before each hop the smaller disks must sit
+    on the third peg, so they are carried there as a tower between hops and
+    onto target after the last one. Before the first hop they are gathered
+    the same way, which is where the walk continues.
+    """
+    distance = 0
+    for disk in range(len(positions), 0, -1):
+        peg = positions[disk - 1]
+        if peg != target:
+            route = solver.route(peg, target)
+            parked = _third_peg(route[0], route[1])
+            distance += 1
+            for hop in zip(route[1:], route[2:]):
+                third = _third_peg(*hop)
+                distance += solver.tower_moves(disk - 1, parked, third) + 1
+                parked = third
+            distance += solver.tower_moves(disk - 1, parked, target)
+            target = _third_peg(route[0], route[1])
+    return distance
+
+
+def next_optimal_move(positions, target='C', solver=HanoiSolver):
+    """Return the first (source, target, disk) move of an optimal solution
+    under the rules of solver, or None when every disk is already on target."""
+    move = None
+    for disk in range(len(positions), 0, -1):
+        peg = positions[disk - 1]
+        if peg != target:
+            route = solver.route(peg, target)
+            move = (peg, route[1], disk)
+            target = _third_peg(route[0], route[1])
+    return move
+
+
+def is_legal_move(towers, source, target, solver=HanoiSolver):
+    """Check whether the top disk of source may be placed on target"""
+    if not solver.allows(source, target) or not towers[source].disks:
+        return False
+    target_disks = towers[target].disks
+    return not target_disks or target_disks[-1] > towers[source].disks[-1]
+
+
+class RecursiveHanoiEngine:
+    """Base class for solvers played straight from their recursion structure.
+    
+    A subclass describes each recursive call as a list of parts, either
+    ('call', kind, n, source) or ('move', disk, source, target) with pegs as
+    0, 1, 2. Call lengths are tabulated once, so move_at() and state_at()
+    descend the recursion in O(n) and iter_moves() streams moves with an
+    explicit stack instead of building a list.
+    """
+    variant = None
+    mode = 'indexed'
+    ROOT_KIND = None
+    KINDS = ()
+    SOURCE_LINES = []
+    
+    def __init__(self, num_disks):
+        self.num_disks = num_disks
+        self._aggregates = {}
+        self.lengths = {kind: [0] for kind in self.KINDS}
+        for n in range(1, num_disks + 1):
+            for kind in self.KINDS:
+                self.lengths[kind].append(sum(
+                    self.lengths[part[1]][part[2]] if part[0] == 'call' else 1
+                    for part in self.parts(kind, n, 0)))
+                    
+    def parts(self, kind, n, source):
+        """Return the parts of call kind(n, source)"""
+        raise NotImplementedError
+        
+    def call_target(self, kind, source):
+        """Return the peg call kind(n, source) moves its tower to"""
+        raise NotImplementedError
+        
+    def format_frame(self, frame):
+        """Return the text of one call stack frame"""
+        raise NotImplementedError
+        
+    @property
+    def total_moves(self):
+        return self.lengths[self.ROOT_KIND][self.num_disks]
+        
+    def _part_length(self, part):
+        return self.lengths[part[1]][part[2]] if part[0] == 'call' else 1
+        
+    def _call_aggregate(self, kind, n, source):
+        """Return (disk counts, 3x3 peg traffic) of a complete call, memoised"""
+        key = (kind, n, source)
+        aggregate = self._aggregates.get(key)
+        if aggregate is None:
+            counts = [0] * n
+            traffic = [[0] * 3 for _ in range(3)]
+            for part in self.parts(kind, n, source):
+                if part[0] == 'move':
+                    counts[part[1] - 1] += 1
+                    traffic[part[2]][part[3]] += 1
+                elif part[2] > 0:
+                    sub_counts, sub_traffic = self._call_aggregate(*part[1:])
+                    for i, count in enumerate(sub_counts):
+                        counts[i] += count
+                    for row, sub_row in zip(traffic, sub_traffic):
+                        for i, count in enumerate(sub_row):
+                            row[i] += count
+            aggregate = (counts, traffic)
+            self._aggregates[key] = aggregate
+        return aggregate
+        
+    def _prefix_aggregate(self, index):
+        """Return (disk counts, peg traffic) of the first index moves.
+        
+        Descends the recursion like move_at(), adding the memoised totals of
+        every complete call passed on the way: O(n) calls, O(n^2) additions.
+        """
+        counts = [0] * self.num_disks
+        traffic = [[0] * 3 for _ in range(3)]
+        index = min(max(index, 0), self.total_moves)
+        kind, n, source = self.ROOT_KIND, self.num_disks, 0
+        while index > 0:
+            for part in self.parts(kind, n, source):
+                length = self._part_length(part)
+                if index < length:
+                    _, kind, n, source = part
+                    break
+                index -= length
+                if part[0] == 'move':
+                    counts[part[1] - 1] += 1
+                    traffic[part[2]][part[3]] += 1
+                elif part[2] > 0:
+                    sub_counts, sub_traffic = self._call_aggregate(*part[1:])
+                    for i, count in enumerate(sub_counts):
+                        counts[i] += count
+                    for row, sub_row in zip(traffic, sub_traffic):
+                        for i, count in enumerate(sub_row):
+                            row[i] += count
+                if index == 0:
+                    break
+        return counts, traffic
+        
+    def disk_move_counts(self, start, stop):
+        """Return how often each disk (index disk - 1) moves in [start, stop)"""
+        before, _ = self._prefix_aggregate(start)
+        until, _ = self._prefix_aggregate(stop)
+        return [b - a for a, b in zip(before, until)]
+        
+    def disk_move_count(self, disk, start, stop):
+        """Return how often disk moves in [start, stop)"""
+        return self.disk_move_counts(start, stop)[disk - 1]
         
-        self.call_stack.pop()
+    def peg_traffic(self, source, target, start, stop):
+        """Return how many moves in [start, stop) go from source to target"""
+        source, target = PEGS.index(source), PEGS.index(target)
+        _, before = self._prefix_aggregate(start)
+        _, until = self._prefix_aggregate(stop)
+        return until[source][target] - before[source][target]
+        
+    def move_at(self, index):
+        """Return the (source, target, disk) of move number index (0-based)"""
+        if not 0 <= index < self.total_moves:
+            raise IndexError(index)
+        kind, n, source = self.ROOT_KIND, self.num_disks, 0
+        while True:
+            for part in self.parts(kind, n, source):
+                length = self._part_length(part)
+                if index < length:
+                    if part[0] == 'move':
+                        return PEGS[part[2]], PEGS[part[3]], part[1]
+                    _, kind, n, source = part
+                    break
+                index -= length
+                
+    def iter_moves(self, start=0):
+        """Yield the moves from index start onwards without storing them"""
+        if start >= self.total_moves:
+            return
+        # Descend to the move at start, keeping the remaining parts of every
+        # call on the way down as the explicit stack
+        stack = []
+        parts = iter(self.parts(self.ROOT_KIND, self.num_disks, 0))
+        index = start
+        while True:
+            part = next(parts)
+            length = self._part_length(part)
+            if index >= length:
+                index -= length
+            elif part[0] == 'move':
+                stack.append(parts)
+                parts = iter([part])
+                break
+            else:
+                stack.append(parts)
+                parts = iter(self.parts(part[1], part[2], part[3]))
+                
+        while True:
+            for part in parts:
+                if part[0] == 'move':
+                    yield PEGS[part[2]], PEGS[part[3]], part[1]
+                elif part[2] > 0:
+                    stack.append(parts)
+                    parts = iter(self.parts(part[1], part[2], part[3]))
+                    break
+            else:
+                if not stack:
+                    return
+                parts = stack.pop()
+                
+    def state_at(self, index):
+        """Return the peg of every disk after index moves, in O(n)"""
+        positions = [None] * self.num_disks
+        kind, n, source = self.ROOT_KIND, self.num_disks, 0
+        while n > 0:
+            parts = self.parts(kind, n, source)
+            peg = source
+            last_call = max(i for i, part in enumerate(parts) if part[0] == 'call')
+            for i, part in enumerate(parts):
+                if part[0] == 'move':
+                    if index > 0:
+                        peg = part[3]
+                        index -= 1
+                    continue
+                length = self.lengths[part[1]][part[2]]
+                # On a boundary the smaller disks sit where the next call
+                # starts, or where the last one ends
+                if index < length or i == last_call:
+                    next_call = part
+                    break
+                index -= length
+            positions[n - 1] = PEGS[peg]
+            _, kind, n, source = next_call
+        return positions
+        
+    def call_stack_at(self, index):
+        """Return the calls active while move index is made, outermost
+        first, as (n, source, target, auxiliary) tuples; empty once solved"""
+        frames = []
+        if not 0 <= index < self.total_moves:
+            return frames
+        kind, n, source = self.ROOT_KIND, self.num_disks, 0
+        while True:
+            target = self.call_target(kind, source)
+            frames.append((n, PEGS[source], PEGS[target], PEGS[3 - source - target]))
+            for part in self.parts(kind, n, source):
+                length = self._part_length(part)
+                if index < length:
+                    if part[0] == 'move':
+                        return frames
+                    _, kind, n, source = part
+                    break
+                index -= length
+
+
+class CyclicHanoiSolver(RecursiveHanoiEngine):
+    """Cyclic rules: disks may only move clockwise, A -> B -> C -> A.
+    
+    Uses the mutual recursion of Q (one step clockwise) and R (two steps);
+    moving the tower from A to C is R(n).
+    """
+    variant = 'cyclic'
+    ROOT_KIND = 'R'
+    KINDS = ('Q', 'R')
+    SOURCE_LINES = [
+        ("def one_step(n, source):      # Q: source -> next peg", True),
+        ("    two_steps(n-1, source)", False),
+        ("    move(n, source, source+1)", False),
+        ("    two_steps(n-1, source+2)", False),
+        ("def two_steps(n, source):     # R: source -> source+2", True),
+        ("    two_steps(n-1, source)", False),
+        ("    move(n, source, source+1)", False),
+        ("    one_step(n-1, source+2)", False),
+        ("    move(n, source+1, source+2)", False),
+        ("    two_steps(n-1, source)", False),
+    ]
+    
+    def call_target(self, kind, source):
+        return (source + (1 if kind == 'Q' else 2)) % 3
+        
+    def allows(self, source, target):
+        return PEGS.index(target) == (PEGS.index(source) + 1) % 3
+        
+    def route(self, source, target):
+        step = PEGS[(PEGS.index(source) + 1) % 3]
+        return (source, target) if step == target else (source, step, target)
+        
+    def tower_moves(self, n, source, target):
+        steps = (PEGS.index(target) - PEGS.index(source)) % 3
+        return self.lengths[('R', 'Q')[steps == 1]][n] if steps else 0
+        
+    def format_frame(self, frame):
+        n, source, target, _ = frame
+        name = 'one_step' if PEGS.index(target) == (PEGS.index(source) + 1) % 3 else 'two_steps'
+        return f"{name}({n}, {source})"
+        
+    def parts(self, kind, n, source):
+        step, skip = (source + 1) % 3, (source + 2) % 3
+        if kind == 'Q':
+            return [('call', 'R', n - 1, source), ('move', n, source, step),
+                    ('call', 'R', n - 1, skip)]
+        return [('call', 'R', n - 1, source), ('move', n, source, step),
+                ('call', 'Q', n - 1, skip), ('move', n, step, skip),
+                ('call', 'R', n - 1, source)]
+
+
+class AdjacentHanoiSolver(RecursiveHanoiEngine):
+    """Adjacent-only rules: disks move only between neighbouring pegs,
+    A <-> B <-> C, so every disk passes through B. Takes 3^n - 1 moves and
+    visits every legal state once.
+    """
+    variant = 'adjacent'
+    ROOT_KIND = 'T'
+    KINDS = ('T',)
+    SOURCE_LINES = [
+        ("def move_across(n, source, target):  # ends only", True),
+        ("    if n > 0:", True),
+        ("        move_across(n-1, source, target)", False),
+        ("        move(n, source, B)", False),
+        ("        move_across(n-1, target, source)", False),
+        ("        move(n, B, target)", False),
+        ("        move_across(n-1, source, target)", False),
+    ]
+    
+    def call_target(self, kind, source):
+        return 2 - source
+        
+    def allows(self, source, target):
+        return source != target and 'B' in (source, target)
+        
+    def route(self, source, target):
+        return (source, target) if self.allows(source, target) else (source, 'B', target)
+        
+    def tower_moves(self, n, source, target):
+        if source == target:
+            return 0
+        # Across the ends takes 3^n - 1 moves, one step half of that
+        across = self.lengths['T'][n]
+        return across // 2 if self.allows(source, target) else across
+        
+    def format_frame(self, frame):
+        return "move_across({}, {}, {})".format(*frame[:3])
+        
+    def parts(self, kind, n, source):
+        target = 2 - source
+        return [('call', 'T', n - 1, source), ('move', n, source, 1),
+                ('call', 'T', n - 1, target), ('move', n, 1, target),
+                ('call', 'T', n - 1, source)]
+
+
+SOLVERS = {
+    'classic': HanoiSolver,
+    'cyclic': CyclicHanoiSolver,
+    'adjacent': AdjacentHanoiSolver,
+}
+
+
+def estimate_memory(num_disks, variant='classic'):
+    """Return the approximate bytes each mode holds for a solution.
+    
+    Eager mode stores a (source, target, disk) tuple per move; the figure
+    comes from sys.getsizeof and is within a few percent of what
+    tracemalloc reports. The other modes only keep O(n) state. Eager is
+    None for variants that cannot be solved eagerly.
+    """
+    state = 1024 + 96 * num_disks
+    estimate = {'eager': None, 'streaming': state, 'indexed': state}
+    if variant == 'classic':
+        moves = (1 << num_disks) - 1
+        estimate['eager'] = moves * (sys.getsizeof((1, 2, 3)) + 8) + state
+    return estimate
+
+
+def calibrate_solve_rate(num_disks=14):
+    """Time an eager solve on this machine and return seconds per move"""
+    solver = HanoiSolver(num_disks)
+    start = time.perf_counter()
+    solver.solve()
+    return (time.perf_counter() - start) / solver.total_moves
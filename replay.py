@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Towers of Hanoi Visualization - Session Replay
+
+Replays a session recorded with File > Start Recording and reports paint
+and playback timings. Runs on Qt's offscreen platform by default, so it can
+be used as a repeatable macro-benchmark on machines without a display.
+
+Usage:
+    python replay.py session.json            # as fast as possible
+    python replay.py session.json --realtime # at the recorded pace
+    python replay.py session.json --frame-cache 256  # 256 MB frame cache
+    python replay.py session.json --backend scene    # retained renderer
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def main():
+    """Replay a recorded session and print timing figures"""
+    parser = argparse.ArgumentParser(description="Replay a recorded Hanoi session")
+    parser.add_argument("session", help="session log written by the recorder")
+    parser.add_argument("--realtime", action="store_true",
+                        help="replay at the recorded pace instead of maximum speed")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of times to replay the session")
+    parser.add_argument("--frame-cache", type=int, metavar="MB",
+                        help="frame cache budget in megabytes (0 disables it)")
+    parser.add_argument("--backend", choices=("painter", "scene"),
+                        help="renderer backend (default: the saved setting)")
+    args = parser.parse_args()
+    
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    
+    from PySide6.QtWidgets import QApplication
+    from ui.main_window import HanoiMainWindow
+    from ui.session_recorder import SessionPlayer, load_session
+    
+    app = QApplication(sys.argv[:1])
+    app.setApplicationName("Towers of Hanoi")
+    app.setOrganizationName("Educational Software")
+    
+    try:
+        log = load_session(args.session)
+    except (OSError, ValueError) as e:
+        print(f"Could not load session: {e}")
+        return 1
+        
+    window = HanoiMainWindow(log['num_disks'], log.get('variant', 'classic'),
+                             log.get('mode', 'eager'))
+    if args.frame_cache is not None:
+        window.hanoi_widget.set_frame_cache_budget(args.frame_cache << 20)
+    if args.backend is not None:
+        window.hanoi_widget.set_backend(args.backend)
+    window.show()
+    app.processEvents()
+    
+    for run in range(1, args.repeat + 1):
+        player = SessionPlayer(window, log)
+        window.hanoi_widget.frame_stats.reset()
+        start = time.perf_counter()
+        if args.realtime:
+            player.finished.connect(app.quit)
+            player.play()
+            app.exec()
+        else:
+            player.play_fast()
+        elapsed = time.perf_counter() - start
+        
+        print(f"Run {run}: {len(log['events'])} events in {elapsed * 1000:.1f} ms, "
+              f"ended at move {window.hanoi_widget.current_move}")
+        for line in window.hanoi_widget.frame_stats.report():
+            print(f"  {line}")
+            
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Towers of Hanoi Visualization - Shared Playback Server
+
+Owns one solution and one playback clock and keeps any number of viewers in
+step over TCP on localhost. Start it, then use File > Connect to Server in
+the application (as many windows as you like):
+
+    python solution_server.py 10                     # classic, 10 disks
+    python solution_server.py 6 --variant cyclic --speed 200 --port 8765
+
+Protocol: one JSON value per line in both directions.
+
+Server to client:
+    {"type": "snapshot", "num_disks": 3, "variant": "classic",
+     "total_moves": 7, "move": 2, "positions": "CBA", "playing": false,
+     "speed": 500}
+        Sent on connect and after every jump. positions holds the peg of
+        every disk, disk 1 first, from solver.state_at(): O(n) at any move.
+    ["m", 1, "AC"]
+        A move: the position changes by +1 (or -1 when stepping back) and
+        the top disk of the first peg goes onto the second.
+    {"type": "state", "playing": true, "speed": 250}
+        Playback was started, paused or changed speed.
+
+Client to server:
+    {"type": "play"}, {"type": "pause"}, {"type": "seek", "move": 40},
+    {"type": "step", "delta": -1}, {"type": "speed", "ms": 250},
+    {"type": "snapshot"} (ask for a fresh snapshot)
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from hanoi import SOLVERS, get_solution
+
+
+DEFAULT_PORT = 8765
+
+# Clients that fall this far behind get a snapshot instead of the backlog
+MAX_BUFFERED_BYTES = 64 * 1024
+
+
+class SolutionServer:
+    """One solution and playback clock shared by every connected client"""
+    
+    def __init__(self, num_disks, variant='classic', speed=500):
+        self.solver = get_solution(num_disks, variant, 'indexed')
+        self.current_move = 0
+        self.playing = False
+        self.speed = speed
+        self.clients = {}
+        self.clock = None
+        
+    def snapshot(self):
+        """Return the message describing the current state in full"""
+        return {
+            'type': 'snapshot',
+            'num_disks': self.solver.num_disks,
+            'variant': self.solver.variant,
+            'total_moves': self.solver.total_moves,
+            'move': self.current_move,
+            'positions': ''.join(self.solver.state_at(self.current_move)),
+            'playing': self.playing,
+            'speed': self.speed,
+        }
+        
+    def playback_state(self):
+        return {'type': 'state', 'playing': self.playing, 'speed': self.speed}
+        
+    @staticmethod
+    def encode(message):
+        return (json.dumps(message, separators=(',', ':')) + '\n').encode()
+        
+    def send(self, writer, message):
+        writer.write(self.encode(message))
+        
+    def broadcast(self, message):
+        """Send a message to every client that is keeping up"""
+        data = self.encode(message)
+        for writer, stale in list(self.clients.items()):
+            if writer.is_closing():
+                del self.clients[writer]
+            elif writer.transport.get_write_buffer_size() > MAX_BUFFERED_BYTES:
+                # Stop queueing moves; it is resynchronised once drained
+                self.clients[writer] = True
+            elif stale:
+                self.clients[writer] = False
+                self.send(writer, self.snapshot())
+            else:
+                writer.write(data)
+                
+    def broadcast_move(self, delta):
+        """Step by one move either way and tell everyone the disk that moved"""
+        if delta > 0:
+            source, target, _ = self.solver.move_at(self.current_move)
+            self.current_move += 1
+        else:
+            self.current_move -= 1
+            target, source, _ = self.solver.move_at(self.current_move)
+        self.broadcast(['m', delta, source + target])
+        
+    def seek(self, index):
+        index = min(max(index, 0), self.solver.total_moves)
+        if abs(index - self.current_move) == 1:
+            self.broadcast_move(index - self.current_move)
+        elif index != self.current_move:
+            self.current_move = index
+            self.broadcast(self.snapshot())
+            
+    def set_playing(self, playing):
+        if playing and self.current_move >= self.solver.total_moves:
+            playing = False
+        if playing == self.playing:
+            return
+        self.playing = playing
+        if playing:
+            self.clock = asyncio.ensure_future(self.run_clock())
+        elif self.clock is not None:
+            self.clock.cancel()
+            self.clock = None
+        self.broadcast(self.playback_state())
+        
+    async def run_clock(self):
+        """Advance one move per tick, scheduled against the loop clock so
+        ticks do not drift however long broadcasting takes"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self.current_move < self.solver.total_moves:
+            next_tick += self.speed / 1000
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self.broadcast_move(1)
+        self.clock = None
+        self.playing = False
+        self.broadcast(self.playback_state())
+        
+    def handle_message(self, writer, message):
+        """Apply one command from a client"""
+        kind = message.get('type')
+        if kind == 'play':
+            self.set_playing(True)
+        elif kind == 'pause':
+            self.set_playing(False)
+        elif kind == 'seek':
+            self.seek(int(message['move']))
+        elif kind == 'step':
+            self.seek(self.current_move + int(message.get('delta', 1)))
+        elif kind == 'speed':
+            self.speed = max(1, int(message['ms']))
+            self.broadcast(self.playback_state())
+        elif kind == 'snapshot':
+            self.send(writer, self.snapshot())
+            
+    async def handle_client(self, reader, writer):
+        """Serve one connection: snapshot first, then commands until EOF"""
+        self.clients[writer] = False
+        self.send(writer, self.snapshot())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    self.handle_message(writer, json.loads(line))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # Malformed command, ignore it and keep the connection
+                    continue
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+            
+    async def serve(self, host='127.0.0.1', port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Run a playback server until interrupted"""
+    parser = argparse.ArgumentParser(description="Share one Hanoi playback between viewers")
+    parser.add_argument("disks", type=int, help="number of disks")
+    parser.add_argument("--variant", choices=sorted(SOLVERS), default="classic",
+                        help="rules variant")
+    parser.add_argument("--speed", type=int, default=500, help="milliseconds per move")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    args = parser.parse_args()
+    
+    server = SolutionServer(args.disks, args.variant, args.speed)
+    print(f"Serving {args.disks} disks ({args.variant}) on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
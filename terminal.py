@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Towers of Hanoi Visualization - Terminal Front End
+
+Plays a solution in a text terminal, for SSH sessions and servers where no
+window can be opened. Only what a move changes is sent to the terminal:
+the disk's old and new slot and the move counter, written with ANSI cursor
+addressing. Moves made within one frame are merged against what is already
+on screen before anything is written, so playback at thousands of moves per
+second costs a few dozen bytes per frame instead of a redraw.
+
+Usage:
+    python terminal.py 10                        # classic, 10 disks
+    python terminal.py 20 --speed 0              # as fast as possible
+    python terminal.py 6 --variant cyclic --speed 200 --start 100
+
+Keys: space play/pause, left/right step, + and - change speed,
+r reset, q quit.
+"""
+
+import argparse
+import os
+import select
+import shutil
+import sys
+import time
+
+from hanoi import PEGS, SOLVERS, get_solution
+
+
+# Time between two screen updates, about one frame at 60 Hz
+FRAME_SECONDS = 0.016
+
+# Background colours given to the disks in turn
+DISK_COLORS = (41, 43, 42, 46, 44, 45)
+
+ESC = '\x1b['
+
+
+class TerminalRenderer:
+    """Draws the towers and keeps track of what the terminal shows.
+    
+    Moves only update the model and mark the slots they touch; flush()
+    compares those slots with what was last written and emits the ones
+    that differ.
+    """
+    
+    def __init__(self, solver, out=sys.stdout, color=True):
+        self.solver = solver
+        self.out = out
+        self.color = color
+        self.bytes_written = 0
+        self.current_move = 0
+        self.towers = {peg: [] for peg in PEGS}
+        self.dirty = set()
+        self.layout()
+        
+    def layout(self):
+        """Fit the columns and rows to the terminal size"""
+        columns, rows = shutil.get_terminal_size()
+        self.size = (columns, rows)
+        num_disks = self.solver.num_disks
+        # Odd width so every disk centres on the peg
+        self.column_width = max(3, ((columns - 4) // 3) | 1)
+        half = self.column_width // 2
+        self.disk_widths = [2 * max(1, (disk * half + num_disks - 1) // num_disks) - 1
+                            for disk in range(1, num_disks + 1)]
+        self.visible_levels = max(1, min(num_disks, rows - 7))
+        self.base_row = 4 + self.visible_levels
+        
+    def column(self, peg):
+        return 2 + PEGS.index(peg) * (self.column_width + 1)
+        
+    def write(self, text):
+        self.out.write(text)
+        self.bytes_written += len(text)
+        
+    def slot_text(self, disk):
+        """Text of one level of a peg column, empty (disk 0) or holding disk"""
+        width = self.column_width
+        if not disk:
+            half = width // 2
+            return ' ' * half + '|' + ' ' * half
+        disk_width = self.disk_widths[disk - 1]
+        label = str(disk) if len(str(disk)) <= disk_width else ''
+        body = label.center(disk_width, ' ' if self.color else '=')
+        if self.color:
+            body = f"{ESC}{DISK_COLORS[(disk - 1) % len(DISK_COLORS)]};30m{body}{ESC}0m"
+        pad = (width - disk_width) // 2
+        return ' ' * pad + body + ' ' * pad
+        
+    def counter_text(self):
+        return f"Move {self.current_move}/{self.solver.total_moves}"
+        
+    def load(self, index, status=''):
+        """Show the position after index moves and redraw everything"""
+        self.current_move = index
+        self.towers = {peg: [] for peg in PEGS}
+        positions = self.solver.state_at(index)
+        for disk in range(self.solver.num_disks, 0, -1):
+            self.towers[positions[disk - 1]].append(disk)
+        self.redraw(status)
+        
+    def redraw(self, status=''):
+        """Clear the screen and draw every cell"""
+        self.layout()
+        columns = self.size[0]
+        title = (f"Towers of Hanoi - {self.solver.variant}, {self.solver.num_disks} disks   "
+                 "space play/pause  ←/→ step  +/- speed  r reset  q quit")
+        self.write(f"{ESC}0m{ESC}2J{ESC}1;1H{title[:columns]}")
+        self.shown = {}
+        for peg in PEGS:
+            for level in range(self.visible_levels):
+                self.dirty.add((peg, level))
+            self.dirty.add((peg, 'count'))
+        base = '▀' * min(columns - 2, 3 * (self.column_width + 1) - 1)
+        self.write(f"{ESC}{self.base_row};2H{base}")
+        self.shown_counter = None
+        self.shown_status = None
+        self.flush(status)
+        
+    def apply_move(self, delta, source, target):
+        """Move the top disk of source onto target, stepping by delta"""
+        disk = self.towers[source].pop()
+        self.dirty.add((source, len(self.towers[source])))
+        self.dirty.add((target, len(self.towers[target])))
+        self.dirty.add((source, 'count'))
+        self.dirty.add((target, 'count'))
+        self.towers[target].append(disk)
+        self.current_move += delta
+        
+    def flush(self, status=''):
+        """Write the cells that differ from the screen, then the counter"""
+        for peg, level in self.dirty:
+            tower = self.towers[peg]
+            if level == 'count':
+                value = f"{peg} {len(tower):<4}"
+                row = self.base_row + 1
+                col = self.column(peg) + self.column_width // 2 - 1
+            elif level < self.visible_levels:
+                value = tower[level] if level < len(tower) else 0
+                row = self.base_row - 1 - level
+                col = self.column(peg)
+            else:
+                continue
+            if self.shown.get((peg, level)) != value:
+                self.shown[(peg, level)] = value
+                text = value if level == 'count' else self.slot_text(value)
+                self.write(f"{ESC}{row};{col}H{text}")
+        self.dirty.clear()
+        counter = self.counter_text()
+        if counter != self.shown_counter or status != self.shown_status:
+            self.shown_counter, self.shown_status = counter, status
+            self.write(f"{ESC}2;1H{counter}   {status}{ESC}K")
+        self.out.flush()
+
+
+class TerminalPlayer:
+    """Playback clock and key handling around a TerminalRenderer"""
+    
+    def __init__(self, renderer, speed=100, start=0, stop_at_end=False):
+        self.renderer = renderer
+        self.solver = renderer.solver
+        self.speed = speed
+        self.playing = True
+        self.stop_at_end = stop_at_end
+        self.moves_played = 0
+        self.renderer.load(min(max(start, 0), self.solver.total_moves), self.status())
+        
+    def status(self):
+        state = "Playing" if self.playing else "Paused"
+        speed = "max speed" if self.speed == 0 else f"{self.speed} ms/move"
+        return f"[{state}, {speed}]"
+        
+    def step(self, delta):
+        """Step one move forward (+1) or back (-1); False at either end"""
+        index = self.renderer.current_move
+        if delta > 0:
+            if index >= self.solver.total_moves:
+                return False
+            source, target, _ = self.solver.move_at(index)
+        else:
+            if index <= 0:
+                return False
+            target, source, _ = self.solver.move_at(index - 1)
+        self.renderer.apply_move(delta, source, target)
+        self.moves_played += 1
+        return True
+        
+    def advance(self, due, deadline):
+        """Play up to due moves, or as many as fit before deadline when
+        running at maximum speed"""
+        if self.speed == 0:
+            while time.perf_counter() < deadline:
+                for _ in range(256):
+                    if not self.step(1):
+                        self.playing = False
+                        return
+        else:
+            for _ in range(due):
+                if not self.step(1):
+                    self.playing = False
+                    return
+                    
+    def handle_key(self, key):
+        """Apply one key press; return False to quit"""
+        if key in ('q', 'Q', '\x03'):
+            return False
+        if key == ' ':
+            self.playing = not self.playing and self.renderer.current_move < self.solver.total_moves
+        elif key == '\x1b[C':
+            self.playing = False
+            self.step(1)
+        elif key == '\x1b[D':
+            self.playing = False
+            self.step(-1)
+        elif key in ('+', '='):
+            self.speed = self.speed // 2
+        elif key == '-':
+            self.speed = min(5000, max(1, self.speed * 2))
+        elif key in ('r', 'R'):
+            self.playing = False
+            self.renderer.load(0, self.status())
+        return True
+        
+    def run(self, keys):
+        """Play until quit, or until the end when stop_at_end is set"""
+        last_tick = time.perf_counter()
+        while True:
+            if not self.playing:
+                timeout = 0.25
+            else:
+                timeout = 0 if self.speed == 0 else FRAME_SECONDS
+            for key in keys.read(timeout):
+                if not self.handle_key(key):
+                    return
+                last_tick = time.perf_counter()
+            if shutil.get_terminal_size() != self.renderer.size:
+                self.renderer.redraw(self.status())
+            if self.playing:
+                now = time.perf_counter()
+                due = 0 if self.speed == 0 else int((now - last_tick) * 1000 / self.speed)
+                if due or self.speed == 0:
+                    last_tick += due * self.speed / 1000
+                    self.advance(due, now + FRAME_SECONDS)
+            else:
+                last_tick = time.perf_counter()
+            self.renderer.flush(self.status())
+            if self.stop_at_end and self.renderer.current_move >= self.solver.total_moves:
+                return
+
+
+class KeyReader:
+    """Reads key presses from a terminal in raw mode, or nothing at all
+    when stdin is not a terminal"""
+    
+    def __init__(self):
+        self.fd = None
+        self.saved = None
+        if sys.stdin.isatty():
+            try:
+                import termios
+                import tty
+            except ImportError:
+                # No raw terminal input on this platform
+                return
+            self.fd = sys.stdin.fileno()
+            self.saved = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd)
+            
+    def read(self, timeout):
+        """Return the keys pressed within timeout seconds"""
+        if self.fd is None:
+            time.sleep(timeout)
+            return []
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        data = os.read(self.fd, 64).decode(errors='ignore')
+        keys = []
+        while data:
+            length = 3 if data.startswith('\x1b[') else 1
+            keys.append(data[:length])
+            data = data[length:]
+        return keys
+        
+    def close(self):
+        if self.saved is not None:
+            import termios
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self.saved)
+
+
+def main():
+    """Play a solution in the terminal"""
+    parser = argparse.ArgumentParser(description="Play Towers of Hanoi in a terminal")
+    parser.add_argument("disks", type=int, help="number of disks")
+    parser.add_argument("--variant", choices=sorted(SOLVERS), default="classic",
+                        help="rules variant")
+    parser.add_argument("--speed", type=int, default=100,
+                        help="milliseconds per move, 0 for as fast as possible")
+    parser.add_argument("--start", type=int, default=0, help="move to start from")
+    parser.add_argument("--no-color", action="store_true", help="draw disks without colour")
+    parser.add_argument("--exit", action="store_true",
+                        help="quit when the solution is complete")
+    args = parser.parse_args()
+    
+    if args.disks < 1:
+        parser.error("at least one disk is needed")
+    solver = get_solution(args.disks, args.variant, 'indexed')
+    renderer = TerminalRenderer(solver, color=not args.no_color)
+    keys = KeyReader()
+    # Alternate screen, hidden cursor
+    renderer.write(f"{ESC}?1049h{ESC}?25l")
+    start = time.perf_counter()
+    player = TerminalPlayer(renderer, max(0, args.speed), args.start, args.exit)
+    try:
+        player.run(keys)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        keys.close()
+        renderer.write(f"{ESC}0m{ESC}?25h{ESC}?1049l")
+        renderer.out.flush()
+    elapsed = time.perf_counter() - start
+    moves = player.moves_played
+    print(f"Played {moves} moves in {elapsed:.2f} s ({moves / max(elapsed, 1e-9):.0f} moves/s), "
+          f"{renderer.bytes_written} bytes written "
+          f"({renderer.bytes_written / max(moves, 1):.1f} bytes/move)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
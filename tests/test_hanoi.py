@@ -0,0 +1,192 @@
+"""
+Checks the indexed solvers in hanoi.py against brute force: moves against
+the streamed solution, positions against replaying the moves, call stacks
+against a traced recursion, distances against a breadth-first search over
+every state, and range queries against a direct scan.
+"""
+
+from collections import deque
+import itertools
+
+import pytest
+
+from hanoi import (PEGS, SOLVERS, HanoiSolver, SolverObserver, initial_towers,
+                   disk_positions, moves_to_goal, next_optimal_move, is_legal_move)
+
+
+MAX_DISKS = 6
+
+CASES = [(variant, n) for variant in sorted(SOLVERS) for n in range(1, MAX_DISKS + 1)]
+
+
+def replay(num_disks, moves, solver):
+    """Return the disk positions before every move and after the last one,
+    checking that each move is legal"""
+    towers = initial_towers(num_disks)
+    states = [disk_positions(towers, num_disks)]
+    for source, target, disk in moves:
+        assert is_legal_move(towers, source, target, solver)
+        assert towers[source].disks[-1] == disk
+        towers[target].push(towers[source].pop())
+        states.append(disk_positions(towers, num_disks))
+    return states
+
+
+def legal_moves(positions, solver):
+    """Return (source, target, disk) of every legal move from positions"""
+    tops = {}
+    for disk in range(len(positions), 0, -1):
+        tops[positions[disk - 1]] = disk
+    return [(source, target, tops[source])
+            for source, target in itertools.permutations(PEGS, 2)
+            if source in tops and solver.allows(source, target)
+            and (target not in tops or tops[target] > tops[source])]
+
+
+def distances_to_goal(num_disks, solver):
+    """Return the fewest moves from every state to all disks on C, found
+    by a breadth-first search backwards from the goal"""
+    predecessors = {}
+    for state in itertools.product(PEGS, repeat=num_disks):
+        for source, target, disk in legal_moves(state, solver):
+            after = list(state)
+            after[disk - 1] = target
+            predecessors.setdefault(tuple(after), []).append(state)
+    goal = ('C',) * num_disks
+    distances = {goal: 0}
+    queue = deque([goal])
+    while queue:
+        state = queue.popleft()
+        for previous in predecessors.get(state, []):
+            if previous not in distances:
+                distances[previous] = distances[state] + 1
+                queue.append(previous)
+    return distances
+
+
+class StackTracer(SolverObserver):
+    """Records the call stack at every move of a traced classic solve"""
+    
+    def __init__(self):
+        self.stack = []
+        self.stacks = []
+        
+    def on_call_enter(self, n, source, target, auxiliary):
+        self.stack.append((n, source, target, auxiliary))
+        
+    def on_move(self, source, target, disk):
+        self.stacks.append(list(self.stack))
+        
+    def on_call_exit(self, n, source, target, auxiliary):
+        self.stack.pop()
+
+
+def traced_stacks(solver):
+    """Return the call stack at every move, from a traced run of the
+    solver's own recursion"""
+    if isinstance(solver, HanoiSolver):
+        tracer = StackTracer()
+        traced = HanoiSolver(solver.num_disks)
+        traced.subscribe(tracer)
+        traced.solve()
+        # The tracer also sees the empty calls at n = 0, which make no move
+        return [[frame for frame in stack if frame[0] > 0] for stack in tracer.stacks]
+        
+    stacks = []
+    
+    def walk(kind, n, source, stack):
+        target = solver.call_target(kind, source)
+        stack = stack + [(n, PEGS[source], PEGS[target], PEGS[3 - source - target])]
+        for part in solver.parts(kind, n, source):
+            if part[0] == 'move':
+                stacks.append(stack)
+            elif part[2] > 0:
+                walk(part[1], part[2], part[3], stack)
+                
+    walk(solver.ROOT_KIND, solver.num_disks, 0, [])
+    return stacks
+
+
+@pytest.fixture(params=CASES, ids=lambda case: f"{case[0]}-{case[1]}")
+def solver(request):
+    variant, num_disks = request.param
+    return SOLVERS[variant](num_disks)
+
+
+def test_move_at_matches_iter_moves(solver):
+    moves = list(solver.iter_moves())
+    assert len(moves) == solver.total_moves
+    assert [solver.move_at(index) for index in range(solver.total_moves)] == moves
+    for start in range(solver.total_moves + 1):
+        assert list(solver.iter_moves(start)) == moves[start:]
+    for index in (-1, solver.total_moves):
+        with pytest.raises(IndexError):
+            solver.move_at(index)
+
+
+def test_eager_solve_matches_indexed():
+    for num_disks in range(1, MAX_DISKS + 1):
+        eager = HanoiSolver(num_disks)
+        eager.solve()
+        assert eager.moves == list(HanoiSolver(num_disks).iter_moves())
+
+
+def test_state_at_matches_replay(solver):
+    states = replay(solver.num_disks, solver.iter_moves(), solver)
+    assert states[-1] == ['C'] * solver.num_disks
+    for index, positions in enumerate(states):
+        assert solver.state_at(index) == positions
+
+
+def test_call_stack_at_matches_traced_solve(solver):
+    stacks = traced_stacks(solver)
+    assert len(stacks) == solver.total_moves
+    for index, stack in enumerate(stacks):
+        assert solver.call_stack_at(index) == stack
+    assert solver.call_stack_at(solver.total_moves) == []
+
+
+def test_total_moves_is_shortest(solver):
+    distances = distances_to_goal(solver.num_disks, solver)
+    assert distances[('A',) * solver.num_disks] == solver.total_moves
+
+
+def test_moves_to_goal_matches_bfs(solver):
+    distances = distances_to_goal(solver.num_disks, solver)
+    assert len(distances) == 3 ** solver.num_disks
+    for state, distance in distances.items():
+        positions = list(state)
+        assert moves_to_goal(positions, solver=solver) == distance
+        move = next_optimal_move(positions, solver=solver)
+        if distance == 0:
+            assert move is None
+            continue
+        # The hint is legal and leads one move closer
+        assert move in legal_moves(positions, solver)
+        source, target, disk = move
+        positions[disk - 1] = target
+        assert distances[tuple(positions)] == distance - 1
+
+
+def test_range_queries_match_scan(solver):
+    moves = list(solver.iter_moves())
+    total = solver.total_moves
+    # Every range for small solutions, a grid of them for large ones
+    step = max(1, total // 40)
+    for start in range(-2, total + 3, step):
+        for stop in range(start, total + 3, step):
+            scanned = moves[max(start, 0):max(stop, 0)]
+            counts = [sum(1 for move in scanned if move[2] == disk)
+                      for disk in range(1, solver.num_disks + 1)]
+            assert solver.disk_move_counts(start, stop) == counts
+            for disk in range(1, solver.num_disks + 1):
+                assert solver.disk_move_count(disk, start, stop) == counts[disk - 1]
+            for source, target in itertools.product(PEGS, repeat=2):
+                assert solver.peg_traffic(source, target, start, stop) == sum(
+                    1 for move in scanned if move[:2] == (source, target))
+
+
+def test_peg_traffic_rejects_unknown_pegs(solver):
+    for source, target in (('D', 'A'), ('A', 'c')):
+        with pytest.raises(ValueError):
+            solver.peg_traffic(source, target, 0, solver.total_moves)
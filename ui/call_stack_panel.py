@@ -0,0 +1,164 @@
+"""
+Virtualised call stack panel for the Towers of Hanoi visualization.
+
+The stack at a move is rebuilt from the solver with call_stack_at() when
+the move changes, as a list of (n, source, target, auxiliary) tuples. A
+repaint only formats and draws the rows inside the visible window, so it
+costs the same whether the stack is 8 or 64 frames deep. The panel
+scrolls with the mouse wheel and keeps following the current (innermost)
+frame until it is scrolled away from it; clicking the title collapses
+the stack to its outermost and current frames.
+"""
+
+from PySide6.QtCore import Qt, QRect, QPointF
+from PySide6.QtGui import QPen, QColor, QFontMetrics
+
+
+class CallStackPanel:
+    """Scroll and collapse state of the call stack panel, and its drawing"""
+    
+    ROW_HEIGHT = 18
+    TITLE_HEIGHT = 35
+    # Largest indentation per stack level, in pixels
+    INDENT = 12
+    # Rows scrolled per wheel notch
+    WHEEL_ROWS = 3
+    
+    def __init__(self):
+        self.solver = None
+        self.move = None
+        self.frames = []
+        self.first_row = 0
+        self.follow = True
+        self.collapsed = False
+        self.rect = QRect()
+        self.title_rect = QRect()
+        
+    def set_position(self, solver, move):
+        """Rebuild the stack when the solver or move changed"""
+        if solver is not self.solver or move != self.move:
+            if solver is not self.solver:
+                self.first_row = 0
+                self.follow = True
+            self.solver = solver
+            self.move = move
+            self.frames = solver.call_stack_at(move)
+            
+    def clear(self):
+        """Forget the solver, so the stack is rebuilt for the next one"""
+        self.solver = None
+        self.move = None
+        self.frames = []
+        
+    def row_count(self):
+        if self.collapsed and len(self.frames) > 3:
+            return 3
+        return len(self.frames)
+        
+    def row(self, index):
+        """Return (depth, frame) of a row; the collapsed marker has frame None"""
+        if self.collapsed and len(self.frames) > 3:
+            if index == 0:
+                return 0, self.frames[0]
+            if index == 1:
+                return 1, None
+            return len(self.frames) - 1, self.frames[-1]
+        return index, self.frames[index]
+        
+    def visible_rows(self):
+        return max(1, (self.rect.height() - self.TITLE_HEIGHT) // self.ROW_HEIGHT)
+        
+    def clamp(self):
+        """Keep the window inside the stack, pinned to the end when following"""
+        last_first = max(0, self.row_count() - self.visible_rows())
+        if self.follow:
+            self.first_row = last_first
+        self.first_row = min(max(self.first_row, 0), last_first)
+        
+    def scroll_by(self, rows):
+        """Scroll by rows; following resumes once the end is visible again"""
+        self.follow = False
+        self.first_row += rows
+        self.clamp()
+        self.follow = self.first_row + self.visible_rows() >= self.row_count()
+        
+    def hide(self):
+        """Note that the panel is not on screen, so it takes no input"""
+        self.rect = QRect()
+        self.title_rect = QRect()
+        
+    def toggle_collapsed(self):
+        self.collapsed = not self.collapsed
+        self.follow = True
+        
+    def wheel(self, pos, angle_delta):
+        """Handle a wheel event at pos; return True if it scrolled the panel"""
+        if not self.rect.contains(pos) or self.row_count() <= self.visible_rows():
+            return False
+        self.scroll_by(-angle_delta * self.WHEEL_ROWS // 120)
+        return True
+        
+    def click(self, pos):
+        """Handle a click at pos; return True if it toggled collapsing"""
+        if self.title_rect.contains(pos):
+            self.toggle_collapsed()
+            return True
+        return False
+        
+    def draw(self, painter, widget, x, y, width, height):
+        """Draw the title and the visible window of frames"""
+        self.rect = QRect(x, y, width, height)
+        self.title_rect = QRect(x, y, width, self.TITLE_HEIGHT - 5)
+        self.set_position(widget.solver, widget.current_move)
+        self.clamp()
+        render_cache = widget.render_cache
+        
+        # The title is elided to the panel so it stays clear of the next one
+        depth = len(self.frames)
+        arrow = "▸" if self.collapsed and depth > 3 else "▾"
+        title = f"{arrow} Call Stack ({depth})"
+        title_font = render_cache.title_font
+        title = QFontMetrics(title_font).elidedText(title, Qt.ElideRight, width - 10)
+        painter.setPen(QPen(widget.text_color))
+        painter.setFont(title_font)
+        painter.drawText(x, y + 20, title)
+        
+        painter.setFont(widget.code_font)
+        if not self.frames:
+            muted = QColor(widget.text_color)
+            muted.setAlpha(140)
+            painter.setPen(QPen(muted))
+            painter.drawText(x, y + 50, "(no calls active)")
+            return
+            
+        ascent = render_cache.ascent(widget.code_font)
+        rows = self.row_count()
+        visible = self.visible_rows()
+        # Indentation shrinks for deep stacks so the innermost frame fits
+        indent = min(self.INDENT, (width // 3) // max(1, depth - 1))
+        highlight = QColor(widget.disk_colors[2 % len(widget.disk_colors)])
+        highlight.setAlpha(70)
+        top = y + self.TITLE_HEIGHT
+        
+        for index in range(self.first_row, min(rows, self.first_row + visible)):
+            row_depth, frame = self.row(index)
+            row_y = top + (index - self.first_row) * self.ROW_HEIGHT
+            if frame is None:
+                text = f"⋮ {depth - 2} frames"
+            else:
+                text = self.solver.format_frame(frame)
+            if row_depth == depth - 1:
+                painter.fillRect(QRect(x, row_y, width - 8, self.ROW_HEIGHT), highlight)
+            painter.setPen(QPen(widget.keyword_color if frame is None else widget.text_color))
+            painter.drawStaticText(QPointF(x + 4 + row_depth * indent,
+                                           row_y + (self.ROW_HEIGHT - ascent) / 2),
+                                   render_cache.static_text(text, widget.code_font))
+                                   
+        # Scroll thumb when part of the stack is out of view
+        if rows > visible:
+            track = visible * self.ROW_HEIGHT
+            thumb = max(8, track * visible // rows)
+            thumb_y = top + (track - thumb) * self.first_row // (rows - visible)
+            thumb_color = QColor(widget.text_color)
+            thumb_color.setAlpha(90)
+            painter.fillRect(QRect(x + width - 5, thumb_y, 4, thumb), thumb_color)
@@ -0,0 +1,108 @@
+"""
+Input and status coalescing for the Towers of Hanoi visualization.
+
+Key auto-repeat delivers a stream of single steps, and every playback change
+used to reformat the status labels. StepCoalescer adds up pending steps and
+applies them as one multi-move advance per frame, with a step size that
+grows the longer an arrow key is held. StatusModel collects change
+notifications from the widget and emits changed at most once per frame, so
+labels are refreshed once however many moves happened in between.
+"""
+
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+# Minimum time between two flushes, about one frame at 60 Hz
+FRAME_MS = 16
+
+
+class FrameThrottle(QObject):
+    """Runs flush() on the next frame boundary after schedule() is called"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.last_flush = 0.0
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        
+    def schedule(self):
+        """Make sure a flush is pending, no sooner than FRAME_MS after the last"""
+        if not self.timer.isActive():
+            elapsed_ms = (time.perf_counter() - self.last_flush) * 1000
+            self.timer.start(max(0, int(FRAME_MS - elapsed_ms)))
+            
+    def flush(self):
+        """Apply pending work now"""
+        self.timer.stop()
+        self.last_flush = time.perf_counter()
+
+
+class StepCoalescer(FrameThrottle):
+    """Merges queued step requests into one advance per frame.
+    
+    A plain key press is one step. While a key auto-repeats, each repeat
+    is worth more steps, doubling every RAMP_MS up to MAX_STEP, so holding
+    an arrow key reaches thousands of moves per second while a tap still
+    moves exactly one. The hold is timed with the key events' own
+    timestamps, so a recorded session ramps the same way when replayed.
+    """
+    
+    RAMP_MS = 250
+    MAX_STEP = 1024
+    
+    def __init__(self, widget):
+        super().__init__(widget)
+        self.widget = widget
+        self.pending = 0
+        self.hold_start = None
+        
+    def push(self, direction, auto_repeat=False, timestamp=0):
+        """Queue a step forward (+1) or back (-1); timestamp is the key
+        event's time in milliseconds"""
+        if not auto_repeat or self.hold_start is None:
+            self.hold_start = timestamp
+        step = 1
+        if auto_repeat:
+            held_ms = max(0, timestamp - self.hold_start)
+            step = min(self.MAX_STEP, 1 << min(self.MAX_STEP.bit_length(), held_ms // self.RAMP_MS))
+        self.pending += direction * step
+        self.schedule()
+        
+    def release(self):
+        """Forget the hold once the key is let go"""
+        self.hold_start = None
+        
+    def flush(self):
+        """Apply every pending step as one advance"""
+        super().flush()
+        pending, self.pending = self.pending, 0
+        if pending:
+            self.widget.step_by(pending)
+
+
+class StatusModel(FrameThrottle):
+    """Emits changed at most once per frame after playback changes"""
+    
+    changed = Signal()
+    
+    def __init__(self, widget, parent=None):
+        super().__init__(parent)
+        self.dirty = False
+        widget.move_changed.connect(self.invalidate)
+        widget.playback_toggled.connect(self.invalidate)
+        widget.manual_move_made.connect(self.invalidate)
+        
+    def invalidate(self, *args):
+        """Note that the status shown is out of date"""
+        self.dirty = True
+        self.schedule()
+        
+    def flush(self):
+        """Emit changed if anything happened since the last flush"""
+        super().flush()
+        if self.dirty:
+            self.dirty = False
+            self.changed.emit()
@@ -0,0 +1,157 @@
+"""
+Side-by-side comparison view for the Towers of Hanoi application.
+Shows several HanoiWidget panes in a grid, driven by one playback clock.
+"""
+
+import math
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+                               QPushButton, QSlider, QLabel, QSizePolicy)
+from PySide6.QtCore import Qt, QTimer
+
+from .hanoi_widget import HanoiWidget
+from .render_cache import RenderCache
+
+
+class ComparisonView(QWidget):
+    """Grid of synchronised HanoiWidget panes sharing solutions and caches"""
+    
+    def __init__(self, puzzles, theme_manager, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Towers of Hanoi - Comparison")
+        self.setMinimumSize(900, 600)
+        # Deleted on close, which drops the panes and with them their hold
+        # on the shared solutions
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        
+        # Panes look up their colors through their parent's theme manager
+        self.theme_manager = theme_manager
+        
+        # One render cache for all panes; solutions are shared through
+        # hanoi.get_solution while the panes hold them, so equal disk counts
+        # cost one solve
+        self.render_cache = RenderCache()
+        self.panes = []
+        
+        # Shared playback clock
+        self.current_move = 0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        
+        self.setup_ui(puzzles)
+        
+    def setup_ui(self, puzzles):
+        """Create the pane grid and the playback controls.
+        
+        puzzles is a list of (num_disks, variant) pairs.
+        """
+        layout = QVBoxLayout(self)
+        
+        grid = QGridLayout()
+        columns = math.ceil(math.sqrt(len(puzzles)))
+        for index, (num_disks, variant) in enumerate(puzzles):
+            pane = HanoiWidget(num_disks, self, render_cache=self.render_cache,
+                               variant=variant)
+            pane.setMinimumSize(280, 220)
+            pane.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.panes.append(pane)
+            grid.addWidget(pane, index // columns, index % columns)
+        layout.addLayout(grid)
+        
+        controls = QHBoxLayout()
+        self.play_pause_btn = QPushButton("Play")
+        self.play_pause_btn.clicked.connect(self.toggle_playback)
+        
+        step_back_btn = QPushButton("◀ Step Back")
+        step_back_btn.clicked.connect(self.step_back)
+        
+        step_forward_btn = QPushButton("Step Forward ▶")
+        step_forward_btn.clicked.connect(self.step_forward)
+        
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset_animation)
+        
+        self.speed_slider = QSlider(Qt.Horizontal)
+        self.speed_slider.setRange(100, 2000)
+        self.speed_slider.setValue(500)
+        self.speed_slider.valueChanged.connect(self.on_speed_changed)
+        
+        self.move_label = QLabel()
+        
+        controls.addWidget(self.play_pause_btn)
+        controls.addWidget(step_back_btn)
+        controls.addWidget(step_forward_btn)
+        controls.addWidget(reset_btn)
+        controls.addStretch()
+        controls.addWidget(self.move_label)
+        controls.addWidget(QLabel("Speed:"))
+        controls.addWidget(self.speed_slider)
+        layout.addLayout(controls)
+        
+        self.update_move_label()
+        
+    def total_moves(self):
+        """Length of the longest solution shown"""
+        return max(pane.solver.total_moves for pane in self.panes)
+        
+    def tick(self):
+        """Advance every pane by one move on the shared clock"""
+        if self.current_move >= self.total_moves():
+            self.toggle_playback()
+            return
+        self.step_forward()
+        
+    def toggle_playback(self):
+        """Start or stop the shared playback clock"""
+        if self.timer.isActive():
+            self.timer.stop()
+            self.play_pause_btn.setText("Play")
+        else:
+            self.timer.start(self.speed_slider.value())
+            self.play_pause_btn.setText("Pause")
+            
+    def step_forward(self):
+        """Advance all panes that still have moves left"""
+        if self.current_move < self.total_moves():
+            self.current_move += 1
+            for pane in self.panes:
+                pane.next_move()
+            self.update_move_label()
+            
+    def step_back(self):
+        """Step back all panes that are past the shared position"""
+        if self.current_move > 0:
+            self.current_move -= 1
+            for pane in self.panes:
+                if pane.current_move > self.current_move:
+                    pane.previous_move()
+            self.update_move_label()
+            
+    def reset_animation(self):
+        """Return every pane to its initial state"""
+        self.timer.stop()
+        self.play_pause_btn.setText("Play")
+        self.current_move = 0
+        for pane in self.panes:
+            pane.reset_animation()
+        self.update_move_label()
+        
+    def on_speed_changed(self, value):
+        """Handle speed slider change"""
+        self.timer.setInterval(value)
+        
+    def update_move_label(self):
+        """Show the shared move counter"""
+        self.move_label.setText(f"Move {self.current_move}/{self.total_moves()}")
+        
+    def update_theme_colors(self):
+        """Refresh the colors of every pane after a theme change"""
+        for pane in self.panes:
+            pane.update_theme_colors()
+            
+    def closeEvent(self, event):
+        """Stop the shared clock and release the panes' solutions"""
+        self.timer.stop()
+        for pane in self.panes:
+            pane.release_solution()
+        event.accept()
@@ -0,0 +1,95 @@
+"""
+Frame cache for the Towers of Hanoi visualization.
+
+Keeps recently painted frames as QImages keyed by move index, so stepping
+back or scrubbing over moves that were just shown blits a stored image
+instead of repainting every panel. Frames are evicted oldest first once
+their total size exceeds a byte budget; a budget of 0 disables the cache.
+"""
+
+from collections import OrderedDict
+
+
+class FrameCache:
+    """Byte-budgeted ring of rendered frames"""
+    
+    def __init__(self, budget_bytes=0):
+        self.budget_bytes = budget_bytes
+        self._frames = OrderedDict()
+        self.used_bytes = 0
+        self.reset_counters()
+        
+    @property
+    def enabled(self):
+        return self.budget_bytes > 0
+        
+    def reset_counters(self):
+        """Forget hit, miss and eviction counts"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+    def set_budget(self, budget_bytes):
+        """Change the budget, evicting frames that no longer fit"""
+        self.budget_bytes = max(0, budget_bytes)
+        self._evict(0)
+        
+    def clear(self):
+        """Drop every frame, e.g. after a resize or theme change"""
+        self._frames.clear()
+        self.used_bytes = 0
+        
+    def get(self, key):
+        """Return the frame stored for key, or None"""
+        frame = self._frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self._frames.move_to_end(key)
+        self.hits += 1
+        return frame
+        
+    def put(self, key, frame):
+        """Store a frame, evicting the oldest ones to stay within budget"""
+        size = frame.sizeInBytes()
+        if size > self.budget_bytes:
+            return
+        old = self._frames.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old.sizeInBytes()
+        self._evict(size)
+        self._frames[key] = frame
+        self.used_bytes += size
+        
+    def _evict(self, incoming):
+        while self._frames and self.used_bytes + incoming > self.budget_bytes:
+            _, frame = self._frames.popitem(last=False)
+            self.used_bytes -= frame.sizeInBytes()
+            self.evictions += 1
+            
+    def __len__(self):
+        return len(self._frames)
+        
+    def summary(self):
+        """Return budget, usage and hit figures"""
+        lookups = self.hits + self.misses
+        return {
+            'budget_mb': self.budget_bytes / (1 << 20),
+            'used_mb': self.used_bytes / (1 << 20),
+            'frames': len(self._frames),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+        }
+        
+    def report(self):
+        """Return the summary as printable lines"""
+        if not self.enabled:
+            return ["Frame cache:    disabled"]
+        stats = self.summary()
+        return [
+            f"Frame cache:    {stats['used_mb']:.1f}/{stats['budget_mb']:.1f} MB, "
+            f"{stats['frames']} frames, {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%}), {stats['evictions']} evicted",
+        ]
@@ -1,27 +1,65 @@
+import time
+
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, QTimer, QRect, Signal
-from PySide6.QtGui import QPainter, QColor, QFont, QPen, QBrush
-from hanoi import HanoiSolver, Tower
+from PySide6.QtCore import Qt, QTimer, QRect, QRectF, QPointF, Signal
+from PySide6.QtGui import QPainter, QPen, QBrush, QColor, QImage
+from hanoi import (PEGS, get_solution, initial_towers, disk_positions,
+                   moves_to_goal, next_optimal_move, is_legal_move)
+from .render_cache import RenderCache
+from .theme_manager import ThemePalette
+from .instrumentation import FrameStats
+from .frame_cache import FrameCache
+from .coalescing import StepCoalescer
+from .scene_renderer import SceneRenderer
+from .call_stack_panel import CallStackPanel
 
 
 class HanoiWidget(QWidget):
-    def __init__(self, num_disks=3, parent=None):
+    # Emitted after a legal manual move: (source, target, disk)
+    manual_move_made = Signal(str, str, int)
+    # Emitted with a human readable reason when a drop is rejected
+    illegal_move_attempted = Signal(str)
+    # Emitted with the new position whenever the solution playback moves;
+    # object, as positions pass the C int range from 32 disks on
+    move_changed = Signal(object)
+    # Emitted when autoplay starts or stops
+    playback_toggled = Signal(bool)
+    
+    # Renderer backends: immediate QPainter drawing or a retained QGraphicsScene
+    BACKENDS = ('painter', 'scene')
+    
+    def __init__(self, num_disks=3, parent=None, render_cache=None, variant='classic',
+                 frame_cache_budget=0, mode='eager', backend='painter'):
         super().__init__(parent)
         self.setMinimumSize(800, 600)
         
-        # Initialize the Hanoi solver
-        self.num_disks = num_disks
-        self.solver = HanoiSolver(num_disks)
-        self.solver.solve()
-        
-        # Reset towers to their initial state for visualization
-        self.solver.towers = {
-            'A': Tower('A'),
-            'B': Tower('B'),
-            'C': Tower('C')
-        }
-        for size in range(self.num_disks, 0, -1):
-            self.solver.towers['A'].push(size)
+        # The solution is shared with every other widget showing the same
+        # disk count; this widget only owns the towers it animates.
+        # Both are filled in by load_puzzle() at the end of construction.
+        self.num_disks = 0
+        self.variant = variant
+        self.mode = mode
+        self.solver = None
+        self.towers = initial_towers(0)
+        
+        # Move iterator and its position when playing a streaming solution
+        self.move_stream = None
+        self.stream_position = None
+        
+        # Fonts, glyph layouts and geometry, shared between panes
+        self.render_cache = render_cache or RenderCache.shared()
+        
+        # Recently painted frames, blitted again when stepping back; the
+        # budget is in bytes and 0 leaves the cache off
+        self.frame_cache = FrameCache(frame_cache_budget)
+        
+        # Paint timings, reported by replays and benchmarks
+        self.frame_stats = FrameStats()
+        self.frame_stats.frame_cache = self.frame_cache
+        
+        # Retained-mode renderer, present while the scene backend is chosen
+        self.backend = 'painter'
+        self.scene_renderer = None
         
         # Animation control
         self.current_move = 0
@@ -32,38 +70,91 @@ class HanoiWidget(QWidget):
         self.timer = QTimer()
         self.timer.timeout.connect(self.next_move)
         
+        # Arrow key steps are merged and applied once per frame
+        self.step_coalescer = StepCoalescer(self)
+        
+        # Scroll and collapse state of the call stack panel
+        self.call_stack_panel = CallStackPanel()
+        
         # Initialize theme colors (will be set by theme manager)
-        self.bg_color = QColor("#ffffff")
-        self.tower_color = QColor("#000000")
-        self.text_color = QColor("#000000")
-        self.disk_colors = []
+        self.palette_colors = None
         self.update_theme_colors()
         
         # Fonts
-        self.font = QFont('Arial', 12)
-        self.code_font = QFont('Courier', 10)
+        self.font = self.render_cache.font
+        self.code_font = self.render_cache.code_font
+        
+        # Optional Sierpinski state graph panel
+        self.show_state_graph = True
+        
+        # Manual play state
+        self.manual_mode = False
+        self.manual_moves = 0
+        self.drag_source = None
+        self.drag_pos = None
+        self.hover_peg = None
+        self.feedback_text = ""
         
         # Enable mouse tracking for hover effects
         self.setMouseTracking(True)
         
+        self.load_puzzle(num_disks, variant, mode)
+        self.set_backend(backend)
+        
+    def load_puzzle(self, num_disks, variant='classic', mode='eager'):
+        """Show a new puzzle in place.
+        
+        The timer, fonts, colors and render caches are kept; only the
+        solution is swapped (served from the solution cache) and the tower
+        lists are refilled. Moves are read with solver.move_at(), or from
+        a running iter_moves() in streaming mode, so only eager classic
+        solutions are ever expanded into a list.
+        """
+        self.num_disks = num_disks
+        self.variant = variant
+        self.mode = mode
+        # Let go of the old solution first, so the cache can free it before
+        # the new one is solved
+        self.solver = None
+        self.move_stream = None
+        self.call_stack_panel.clear()
+        self.solver = get_solution(num_disks, variant, mode)
+        self.frame_cache.clear()
+        self.reset_animation()
+        self.refresh_scene()
+        
+    def release_solution(self):
+        """Stop playing and let go of the shared solution, so the solution
+        cache can free it once no other widget shows it. Only for a widget
+        that is being discarded; load_puzzle() gives it a solution again."""
+        self.timer.stop()
+        self.step_coalescer.timer.stop()
+        self.move_stream = None
+        self.call_stack_panel.clear()
+        self.solver = None
+        
     def update_theme_colors(self):
         """Update colors from the theme manager."""
-        if self.parent() and hasattr(self.parent(), 'theme_manager'):
-            colors = self.parent().theme_manager.get_theme_colors()
-            self.bg_color = QColor(colors['background'])
-            self.tower_color = QColor(colors['tower'])
-            self.text_color = QColor(colors['text'])
-            self.disk_colors = [QColor(c) for c in colors['disk_colors']]
+        # Once laid out our parent is a container, so ask the window
+        owner = self.window()
+        if hasattr(owner, 'theme_manager'):
+            self.set_palette(owner.theme_manager.get_palette())
         else:
             # Default colors for fallback
-            self.bg_color = QColor("#ffffff")
-            self.tower_color = QColor("#000000")
-            self.text_color = QColor("#000000")
-            self.disk_colors = [
-                QColor('#ff6b6b'), QColor('#4ecdc4'), QColor('#45b7d1'),
-                QColor('#f9ca24'), QColor('#f0932b'), QColor('#eb4d4b'),
-                QColor('#6c5ce7'), QColor('#a29bfe')
-            ]
+            self.set_palette(ThemePalette.default())
+            
+    def set_palette(self, palette):
+        """Swap in a prebuilt ThemePalette without re-deriving any colors"""
+        if palette is self.palette_colors:
+            return
+        self.palette_colors = palette
+        self.frame_cache.clear()
+        self.bg_color = palette.background
+        self.tower_color = palette.tower
+        self.text_color = palette.text
+        self.keyword_color = palette.keyword
+        self.disk_colors = palette.disk_colors
+        self.refresh_scene()
         
         # Trigger a repaint
         if self.isVisible():
@@ -71,33 +162,129 @@ class HanoiWidget(QWidget):
 
     def paintEvent(self, event):
         """Main drawing method"""
+        if self.scene_renderer is not None and self.scene_renderer.active:
+            # The scene's view covers the widget and paints itself
+            return
+        start = time.perf_counter()
         painter = QPainter(self)
+        key = self.frame_key()
+        if key is None:
+            self.paint_frame(painter)
+        else:
+            frame = self.frame_cache.get(key)
+            if frame is None:
+                frame = self.render_frame()
+                self.frame_cache.put(key, frame)
+            painter.drawImage(0, 0, frame)
+        painter.end()
+        self.frame_stats.record_frame(time.perf_counter() - start)
+        
+    def frame_key(self):
+        """Return the frame cache key of the current frame, or None.
+        
+        Everything else a frame depends on (size, palette, puzzle, panels)
+        clears the cache when it changes, so the position is enough.
+        Manual play follows the mouse and is never cached.
+        """
+        if not self.frame_cache.enabled or self.manual_mode:
+            return None
+        return (self.current_move, self.auto_play)
+        
+    def render_frame(self):
+        """Paint the current frame into a QImage at device resolution"""
+        ratio = self.devicePixelRatioF()
+        frame = QImage(round(self.width() * ratio), round(self.height() * ratio),
+                       QImage.Format_ARGB32_Premultiplied)
+        frame.setDevicePixelRatio(ratio)
+        painter = QPainter(frame)
+        self.paint_frame(painter)
+        painter.end()
+        return frame
+        
+    def resizeEvent(self, event):
+        """Cached frames and scene items have the old size, drop them"""
+        self.frame_cache.clear()
+        super().resizeEvent(event)
+        self.refresh_scene()
+        
+    def set_backend(self, backend):
+        """Switch between the 'painter' and 'scene' renderer backends"""
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown renderer backend: {backend}")
+        self.backend = backend
+        if backend == 'scene' and self.scene_renderer is None:
+            self.scene_renderer = SceneRenderer(self)
+        elif backend == 'painter' and self.scene_renderer is not None:
+            self.scene_renderer.close()
+            self.scene_renderer = None
+        self.refresh_scene()
+        self.update()
+        
+    def refresh_scene(self):
+        """Rebuild the scene after a layout or style change; manual play
+        uses the painter path for its drag and hover feedback"""
+        if self.scene_renderer is None:
+            return
+        if self.manual_mode:
+            self.scene_renderer.view.hide()
+        else:
+            self.scene_renderer.rebuild()
+            self.scene_renderer.view.show()
+            
+    def set_frame_cache_budget(self, budget_bytes):
+        """Set the frame cache budget in bytes; 0 turns the cache off"""
+        self.frame_cache.set_budget(budget_bytes)
+        
+    def paint_frame(self, painter):
+        """Draw the whole widget with the given painter"""
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Clear background
         painter.fillRect(self.rect(), self.bg_color)
         
-        # Calculate drawing areas
-        widget_width = self.width()
-        widget_height = self.height()
-        
         # Main visualization area (left side)
-        viz_width = min(widget_width * 0.6, widget_width - 400)
-        viz_height = widget_height
+        viz_width, viz_height = self.viz_size()
         
         # Draw the visualization
         self.draw_towers(painter, viz_width, viz_height)
         self.draw_disks(painter, viz_width, viz_height)
         
         # Draw side panel (right side)
+        self.draw_side_panels(painter)
+        
+        # Draw controls
+        self.draw_controls(painter, 20, self.height() - 60, viz_width - 40, 40)
+        
+    def draw_side_panels(self, painter):
+        """Draw the code, call stack and state graph panels right of the towers"""
+        widget_width = self.width()
+        viz_width, viz_height = self.viz_size()
         if widget_width > 800:
             panel_x = viz_width + 20
-            self.draw_code_panel(painter, panel_x, 20, widget_width - panel_x - 20, viz_height - 40)
+            panel_width = widget_width - panel_x - 20
+            self.draw_code_panel(painter, panel_x, 20, panel_width, viz_height - 40)
+            
+            # The state graph shares the lower half with the call stack
+            stack_width = panel_width
+            if self.show_state_graph and panel_width >= 400:
+                stack_width = panel_width // 2
+                self.draw_state_graph_panel(painter, panel_x + stack_width, viz_height // 2,
+                                            panel_width - stack_width, viz_height // 2 - 20)
             self.draw_call_stack_panel(painter, panel_x, viz_height // 2, 
-                                     widget_width - panel_x - 20, viz_height // 2 - 20)
+                                     stack_width, viz_height // 2 - 20)
+        else:
+            self.call_stack_panel.hide()
+            
+    def viz_size(self):
+        """Return the (width, height) of the tower visualization area"""
+        if self.width() <= 800:
+            # No side panels are drawn, the towers get the whole widget
+            return self.width(), self.height()
+        return min(self.width() * 0.6, self.width() - 400), self.height()
         
-        # Draw controls
-        self.draw_controls(painter, 20, widget_height - 60, viz_width - 40, 40)
+    def tower_layout(self, width, height):
+        """Return (start_x, start_y, tower_width, tower_height, peg_positions)"""
+        return self.render_cache.tower_layout(width, height, self.num_disks)[:5]
         
     def draw_towers(self, painter, width, height):
         """Draw the three towers"""
@@ -105,10 +292,8 @@ class HanoiWidget(QWidget):
         painter.setBrush(QBrush(self.tower_color))
         
         # Calculate tower positions
-        tower_width = width * 0.8
-        tower_height = height * 0.6
-        tower_start_x = (width - tower_width) // 2
-        tower_start_y = height * 0.2
+        tower_start_x, tower_start_y, tower_width, tower_height, peg_positions = \
+            self.tower_layout(width, height)
         
         # Draw base
         base_rect = QRect(tower_start_x, tower_start_y + tower_height - 20, 
@@ -116,13 +301,14 @@ class HanoiWidget(QWidget):
         painter.drawRect(base_rect)
         
         # Draw the three pegs
-        peg_positions = [
-            tower_start_x + tower_width * 0.2,
-            tower_start_x + tower_width * 0.5,
-            tower_start_x + tower_width * 0.8
-        ]
-        
         for i, pos in enumerate(peg_positions):
+            # Highlight the peg under the cursor in manual mode
+            if self.manual_mode and self.hover_peg == PEGS[i]:
+                painter.setPen(QPen(self.disk_colors[2 % len(self.disk_colors)], 3))
+            else:
+                painter.setPen(QPen(self.tower_color, 3))
+            painter.setBrush(QBrush(self.tower_color))
+            
             # Draw peg
             peg_rect = QRect(pos - 5, tower_start_y, 10, tower_height - 20)
             painter.drawRect(peg_rect)
@@ -135,159 +321,373 @@ class HanoiWidget(QWidget):
             
     def draw_disks(self, painter, width, height):
         """Draw the disks on the towers"""
-        # Calculate tower positions (same as in draw_towers)
-        tower_width = width * 0.8
-        tower_height = height * 0.6
-        tower_start_x = (width - tower_width) // 2
-        tower_start_y = height * 0.2
-        
-        peg_positions = [
-            tower_start_x + tower_width * 0.2,
-            tower_start_x + tower_width * 0.5,
-            tower_start_x + tower_width * 0.8
-        ]
-        
-        tower_mapping = {'A': 0, 'B': 1, 'C': 2}
-        
-        for tower_name, tower in self.solver.towers.items():
-            peg_x = peg_positions[tower_mapping[tower_name]]
-            
+        disk_widths, disk_height = self.render_cache.tower_layout(width, height, self.num_disks)[5:]
+        
+        for tower_name, tower in self.towers.items():
             for i, disk in enumerate(tower.disks):
-                # Calculate disk dimensions
-                disk_width = 30 + disk * 25
-                disk_height = 20
-                disk_x = peg_x - disk_width // 2
-                disk_y = tower_start_y + tower_height - 40 - i * (disk_height + 2)
-                
-                # Draw disk
-                color = self.disk_colors[min(disk - 1, len(self.disk_colors) - 1)]
-                painter.setBrush(QBrush(color))
-                painter.setPen(QPen(self.tower_color, 2))
+                # The disk being dragged is drawn under the cursor instead
+                if tower_name == self.drag_source and i == len(tower.disks) - 1:
+                    continue
+                    
+                self.draw_disk(painter, self.disk_rect(width, height, tower_name, i, disk), disk)
                 
-                disk_rect = QRect(disk_x, disk_y, disk_width, disk_height)
-                painter.drawRoundedRect(disk_rect, 5, 5)
+        if self.drag_source is not None and self.drag_pos is not None:
+            disk = self.towers[self.drag_source].disks[-1]
+            disk_width = disk_widths[disk - 1]
+            disk_rect = QRect(self.drag_pos.x() - disk_width // 2,
+                              self.drag_pos.y() - disk_height // 2, disk_width, disk_height)
+            self.draw_disk(painter, disk_rect, disk)
                 
-                # Draw disk number
-                painter.setPen(QPen(self.text_color))
-                painter.setFont(self.font)
-                painter.drawText(disk_rect, Qt.AlignCenter, str(disk))
+    def disk_rect(self, width, height, peg, level, disk):
+        """Return the rect of disk resting at level (0 = bottom) on peg"""
+        (tower_start_x, tower_start_y, tower_width, tower_height, peg_positions,
+         disk_widths, disk_height) = self.render_cache.tower_layout(width, height, self.num_disks)
+        disk_width = disk_widths[disk - 1]
+        disk_x = peg_positions[PEGS.index(peg)] - disk_width // 2
+        disk_y = tower_start_y + tower_height - 40 - level * (disk_height + 2)
+        return QRect(disk_x, disk_y, disk_width, disk_height)
+        
+    def draw_disk(self, painter, disk_rect, disk):
+        """Draw a single disk with its number"""
+        color = self.disk_colors[min(disk - 1, len(self.disk_colors) - 1)]
+        painter.setBrush(QBrush(color))
+        painter.setPen(QPen(self.tower_color, 2))
+        painter.drawRoundedRect(disk_rect, 5, 5)
+        
+        # Draw disk number from the shared glyph cache
+        if disk_rect.height() >= 12:
+            label = self.render_cache.static_text(str(disk), self.font)
+            size = label.size()
+            painter.setPen(QPen(self.text_color))
+            painter.setFont(self.font)
+            painter.drawStaticText(QPointF(disk_rect.center().x() - size.width() / 2,
+                                           disk_rect.center().y() - size.height() / 2 + 1),
+                                   label)
                 
     def draw_code_panel(self, painter, x, y, width, height):
         """Draw the code visualization panel"""
         painter.setPen(QPen(self.text_color))
-        painter.setFont(QFont('Arial', 14, QFont.Bold))
+        painter.setFont(self.render_cache.title_font)
         painter.drawText(x, y + 20, "Move Function Code")
         
-        # Code lines with syntax highlighting
-        code_lines = [
-            ("def _move_disks(self, n, source, target, auxiliary):", QColor(0, 0, 255)),
-            ("    if n > 0:", QColor(0, 0, 255)),
-            ("        self._move_disks(n-1, source, auxiliary, target)", self.text_color),
-            ("        disk = self.towers[source].pop()", self.text_color),
-            ("        self.towers[target].push(disk)", self.text_color),
-            ("        self.moves.append((source, target, disk))", self.text_color),
-            ("        self._move_disks(n-1, auxiliary, target, source)", self.text_color),
-        ]
-        
+        # Code lines of the current solver with syntax highlighting
         painter.setFont(self.code_font)
+        ascent = self.render_cache.ascent(self.code_font)
         y_offset = y + 50
-        for line, color in code_lines:
-            painter.setPen(QPen(color))
-            painter.drawText(x, y_offset, line)
+        for line, is_keyword in self.solver.SOURCE_LINES:
+            painter.setPen(QPen(self.keyword_color if is_keyword else self.text_color))
+            painter.drawStaticText(QPointF(x, y_offset - ascent),
+                                   self.render_cache.static_text(line, self.code_font))
             y_offset += 20
             
     def draw_call_stack_panel(self, painter, x, y, width, height):
-        """Draw the call stack visualization panel"""
-        painter.setPen(QPen(self.text_color))
-        painter.setFont(QFont('Arial', 14, QFont.Bold))
-        painter.drawText(x, y + 20, "Recursive Call Stack")
+        """Draw the visible part of the call stack at the current move"""
+        self.call_stack_panel.draw(painter, self, x, y, width, height)
+        
+    def refresh_panels(self):
+        """Repaint after a side panel changed its own view state"""
+        self.frame_cache.clear()
+        if self.scene_renderer is not None:
+            self.scene_renderer.sync()
+        self.update()
         
-        if self.current_move < len(self.solver.call_stack_history):
-            painter.setFont(self.code_font)
-            y_offset = y + 50
+    def wheelEvent(self, event):
+        """Scroll the call stack panel"""
+        if self.call_stack_panel.wheel(event.position().toPoint(), event.angleDelta().y()):
+            self.refresh_panels()
+            event.accept()
+        else:
+            super().wheelEvent(event)
             
-            for i, call in enumerate(self.solver.call_stack_history[self.current_move]):
-                indentation = "  " * i
-                painter.drawText(x, y_offset, indentation + call)
-                y_offset += 18
-                
-                # Don't draw too many to avoid overflow
-                if y_offset > y + height - 20:
-                    break
-                    
+    def draw_state_graph_panel(self, painter, x, y, width, height):
+        """Draw the current configuration as a point on the state graph"""
+        painter.setPen(QPen(self.text_color))
+        painter.setFont(self.render_cache.title_font)
+        painter.drawText(x, y + 20, "State Graph")
+        
+        graph_color = QColor(self.text_color)
+        graph_color.setAlpha(110)
+        self.render_cache.state_graph.draw(
+            painter, QRectF(x, y + 35, width, height - 35), self.num_disks,
+            disk_positions(self.towers, self.num_disks), self.solver, self.current_move,
+            graph_color, self.disk_colors[2 % len(self.disk_colors)], self.disk_colors[0],
+            show_path=not self.manual_mode)
+            
+    def set_show_state_graph(self, visible):
+        """Show or hide the state graph panel"""
+        self.show_state_graph = visible
+        self.frame_cache.clear()
+        self.refresh_scene()
+        self.update()
+        
     def draw_controls(self, painter, x, y, width, height):
         """Draw control information"""
         painter.setPen(QPen(self.text_color))
         painter.setFont(self.font)
         
+        if self.manual_mode:
+            self.draw_manual_controls(painter, x, y, width, height)
+            return
+            
         controls_text = "← Previous | → Next | Space: Play/Pause"
         painter.drawText(x, y + 15, controls_text)
         
-        move_text = f"Move {self.current_move}/{len(self.solver.moves)}"
+        move_text = f"Move {self.current_move}/{self.solver.total_moves}"
         painter.drawText(x, y + 35, move_text)
         
         status_text = "Playing" if self.auto_play else "Paused"
         painter.drawText(x + 300, y + 35, f"Status: {status_text}")
         
+    def draw_manual_controls(self, painter, x, y, width, height):
+        """Draw the manual play readout: move count, distance and hint"""
+        positions = disk_positions(self.towers, self.num_disks)
+        remaining = moves_to_goal(positions, solver=self.solver)
+        
+        if remaining == 0:
+            painter.drawText(x, y + 15, f"Solved in {self.manual_moves} moves "
+                                        f"(optimal: {self.solver.total_moves})")
+        else:
+            hint = next_optimal_move(positions, solver=self.solver)
+            painter.drawText(x, y + 15, f"Drag disks between pegs | "
+                                        f"Hint: disk {hint[2]} {hint[0]} → {hint[1]}")
+        
+        painter.drawText(x, y + 35, f"Your moves: {self.manual_moves}")
+        painter.drawText(x + 150, y + 35, f"Optimal remaining: {remaining}")
+        
+        if self.feedback_text:
+            painter.setPen(QPen(self.disk_colors[0]))
+            painter.drawText(x + 350, y + 35, self.feedback_text)
+            
+    def optimal_moves_remaining(self):
+        """Minimum number of moves from the current state to the goal"""
+        return moves_to_goal(disk_positions(self.towers, self.num_disks), solver=self.solver)
+        
+    def set_manual_mode(self, enabled):
+        """Switch between solution playback and interactive manual play"""
+        self.reset_animation()
+        self.manual_mode = enabled
+        self.frame_cache.clear()
+        self.refresh_scene()
+        self.update()
+        
+    def peg_at(self, x, y):
+        """Return the peg name closest to the given point, or None"""
+        width, height = self.viz_size()
+        if x < 0 or x > width or y < 0 or y > height:
+            return None
+        _, _, tower_width, _, peg_positions = self.tower_layout(width, height)
+        distances = [abs(x - pos) for pos in peg_positions]
+        nearest = distances.index(min(distances))
+        if distances[nearest] > tower_width * 0.15:
+            return None
+        return PEGS[nearest]
+        
+    def mousePressEvent(self, event):
+        """Pick up the top disk of a peg in manual mode"""
+        if event.button() == Qt.LeftButton and self.call_stack_panel.click(event.position().toPoint()):
+            self.refresh_panels()
+            return
+        if not self.manual_mode or event.button() != Qt.LeftButton:
+            super().mousePressEvent(event)
+            return
+        pos = event.position().toPoint()
+        peg = self.peg_at(pos.x(), pos.y())
+        if peg is not None and self.towers[peg].disks:
+            self.drag_source = peg
+            self.drag_pos = pos
+            self.feedback_text = ""
+            self.update()
+            
+    def mouseMoveEvent(self, event):
+        """Track the dragged disk and highlight the peg under the cursor"""
+        if not self.manual_mode:
+            super().mouseMoveEvent(event)
+            return
+        pos = event.position().toPoint()
+        hover_peg = self.peg_at(pos.x(), pos.y())
+        if self.drag_source is not None:
+            self.drag_pos = pos
+            self.hover_peg = hover_peg
+            self.update()
+        elif hover_peg != self.hover_peg:
+            self.hover_peg = hover_peg
+            self.update()
+            
+    def mouseReleaseEvent(self, event):
+        """Drop the dragged disk, checking the move is legal"""
+        if not self.manual_mode or self.drag_source is None:
+            super().mouseReleaseEvent(event)
+            return
+        pos = event.position().toPoint()
+        source = self.drag_source
+        target = self.peg_at(pos.x(), pos.y())
+        self.drag_source = None
+        self.drag_pos = None
+        
+        if target is not None and target != source:
+            towers = self.towers
+            disk = towers[source].disks[-1]
+            if is_legal_move(towers, source, target, self.solver):
+                towers[target].push(towers[source].pop())
+                self.manual_moves += 1
+                self.feedback_text = ""
+                self.manual_move_made.emit(source, target, disk)
+            elif not self.solver.allows(source, target):
+                self.feedback_text = (f"Illegal: {self.solver.variant} rules do not "
+                                      f"allow {source} → {target}")
+                self.illegal_move_attempted.emit(self.feedback_text)
+            else:
+                self.feedback_text = (f"Illegal: disk {disk} cannot go on "
+                                      f"disk {towers[target].disks[-1]}")
+                self.illegal_move_attempted.emit(self.feedback_text)
+        self.update()
+        
     def keyPressEvent(self, event):
         """Handle keyboard input"""
-        if event.key() == Qt.Key_Space:
+        if self.manual_mode:
+            super().keyPressEvent(event)
+        elif event.key() == Qt.Key_Space:
             self.toggle_autoplay()
         elif event.key() == Qt.Key_Right and not self.auto_play:
-            self.next_move()
+            self.step_coalescer.push(1, event.isAutoRepeat(), event.timestamp())
         elif event.key() == Qt.Key_Left and not self.auto_play:
-            self.previous_move()
+            self.step_coalescer.push(-1, event.isAutoRepeat(), event.timestamp())
         else:
             super().keyPressEvent(event)
             
+    def keyReleaseEvent(self, event):
+        """End an arrow key hold so the next press steps by one again"""
+        if not event.isAutoRepeat():
+            self.step_coalescer.release()
+        super().keyReleaseEvent(event)
+        
     def toggle_autoplay(self):
         """Toggle between play and pause"""
+        if self.manual_mode:
+            return
         self.auto_play = not self.auto_play
         if self.auto_play:
             self.timer.start(self.animation_speed)
         else:
             self.timer.stop()
         self.update()
+        self.playback_toggled.emit(self.auto_play)
         
     def next_move(self):
         """Execute the next move"""
-        if self.current_move < len(self.solver.moves):
-            source, target, disk = self.solver.moves[self.current_move]
-            self.solver.towers[target].push(
-                self.solver.towers[source].pop())
+        if self.manual_mode:
+            return
+        if self.current_move < self.solver.total_moves:
+            source, target, disk = self.upcoming_move()
+            self.towers[target].push(
+                self.towers[source].pop())
             self.current_move += 1
             self.update()
+            self.move_changed.emit(self.current_move)
         else:
             # Animation finished
             if self.auto_play:
                 self.toggle_autoplay()
                 
+    def upcoming_move(self):
+        """Return the move made from the current position.
+        
+        Streaming solutions keep an iterator running alongside playback and
+        restart it only after a jump, so forward play never descends the
+        recursion; other modes read the move by index.
+        """
+        if self.solver.mode != 'streaming':
+            return self.solver.move_at(self.current_move)
+        if self.move_stream is None or self.stream_position != self.current_move:
+            self.move_stream = self.solver.iter_moves(self.current_move)
+        self.stream_position = self.current_move + 1
+        return next(self.move_stream)
+        
     def previous_move(self):
         """Undo the previous move"""
-        if self.current_move > 0:
+        if self.current_move > 0 and not self.manual_mode:
             self.current_move -= 1
-            source, target, disk = self.solver.moves[self.current_move]
+            source, target, disk = self.solver.move_at(self.current_move)
             # Reverse the move: move disk from target back to source
-            self.solver.towers[source].push(
-                self.solver.towers[target].pop())
+            self.towers[source].push(
+                self.towers[target].pop())
             self.update()
+            self.move_changed.emit(self.current_move)
             
+    def step_by(self, delta):
+        """Move delta moves forward (or back if negative) with one repaint.
+        
+        Short steps replay the moves; anything longer than the disk count
+        jumps through state_at(), which is O(n) however far it goes.
+        """
+        if self.manual_mode or not delta:
+            return
+        target = min(max(self.current_move + delta, 0), self.solver.total_moves)
+        if abs(target - self.current_move) > self.num_disks:
+            self.seek(target)
+            return
+        while self.current_move < target:
+            source, target_peg, disk = self.upcoming_move()
+            self.towers[target_peg].push(self.towers[source].pop())
+            self.current_move += 1
+        while self.current_move > target:
+            self.current_move -= 1
+            source, target_peg, disk = self.solver.move_at(self.current_move)
+            self.towers[source].push(self.towers[target_peg].pop())
+        self.update()
+        self.move_changed.emit(self.current_move)
+        
+    def seek(self, index):
+        """Jump to the position after index moves, in O(n) via state_at()"""
+        if self.manual_mode:
+            return
+        index = min(max(index, 0), self.solver.total_moves)
+        self.show_position(index, self.solver.state_at(index))
+        
+    def show_position(self, index, positions):
+        """Show the configuration positions (peg per disk, disk 1 first)
+        as the position after index moves"""
+        for tower in self.towers.values():
+            tower.disks.clear()
+        for disk in range(self.num_disks, 0, -1):
+            self.towers[positions[disk - 1]].disks.append(disk)
+        self.current_move = index
+        self.update()
+        self.move_changed.emit(self.current_move)
+        
+    def apply_move(self, delta, source, target):
+        """Apply a move made elsewhere (e.g. by a playback server).
+        
+        Returns False, changing nothing, if the move does not fit the
+        towers shown, so the caller can ask for a fresh snapshot.
+        """
+        towers = self.towers
+        if not towers[source].disks or (towers[target].disks and
+                                        towers[target].disks[-1] < towers[source].disks[-1]):
+            return False
+        towers[target].push(towers[source].pop())
+        self.current_move += delta
+        self.update()
+        self.move_changed.emit(self.current_move)
+        return True
+        
     def reset_animation(self):
         """Reset to initial state"""
         self.auto_play = False
         self.timer.stop()
         self.current_move = 0
-        
-        # Reset towers
-        self.solver.towers = {
-            'A': Tower('A'),
-            'B': Tower('B'),
-            'C': Tower('C')
-        }
-        for size in range(self.num_disks, 0, -1):
-            self.solver.towers['A'].push(size)
+        self.manual_moves = 0
+        self.drag_source = None
+        self.drag_pos = None
+        self.feedback_text = ""
+        
+        # Reset towers, reusing their disk lists
+        for tower in self.towers.values():
+            tower.disks.clear()
+        self.towers['A'].disks.extend(range(self.num_disks, 0, -1))
             
         self.update()
+        self.move_changed.emit(self.current_move)
         
     def set_animation_speed(self, speed):
         """Set the animation speed in milliseconds"""
@@ -1,20 +1,72 @@
+import sys
+
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QSpinBox, QGridLayout, QWidget)
-from PySide6.QtCore import Qt
+                             QPushButton, QSpinBox, QGridLayout, QWidget, QComboBox)
+from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QFont
 
+from hanoi import SOLVERS, estimate_memory, calibrate_solve_rate
+
+
+def format_bytes(size):
+    """Return a byte count as a short human readable string"""
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def format_duration(seconds):
+    """Return a duration as a short human readable string"""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    for unit, length in (("years", 365 * 86400), ("days", 86400), ("h", 3600), ("min", 60)):
+        if seconds >= length:
+            return f"{seconds / length:,.1f} {unit}"
+    return f"{seconds:.1f} s"
+
 
 class DiskInputDialog(QDialog):
-    def __init__(self, parent=None):
+    # Rules variants offered in the dialog: (solver variant, label)
+    VARIANTS = [
+        ('classic', "Classic"),
+        ('cyclic', "Cyclic (clockwise moves only)"),
+        ('adjacent', "Adjacent pegs only (A ↔ B ↔ C)"),
+    ]
+    
+    # Solution modes offered in the dialog: (hanoi mode, label)
+    MODES = [
+        ('eager', "Eager (store every move)"),
+        ('streaming', "Streaming (generate moves while playing)"),
+        ('indexed', "Indexed (compute any move on demand)"),
+    ]
+    
+    MAX_DISKS = 32
+    
+    # Default memory budget for eager solutions, overridden by the
+    # "memory_budget_mb" setting
+    MEMORY_BUDGET_MB = 512
+    
+    def __init__(self, parent=None, speed=500):
         super().__init__(parent)
         self.setWindowTitle("Towers of Hanoi - Setup")
         self.setModal(True)
-        self.setFixedSize(500, 350)
+        self.setFixedSize(500, 600)
         
         # Store the selected number of disks
         self.selected_disks = 3
         
+        # Playback speed in ms per move, for the playback estimate
+        self.speed = speed
+        
+        # Set once the user picks a mode, so it is no longer auto-selected
+        self.mode_chosen = False
+        
+        self.settings = QSettings()
+        self.seconds_per_move = self.solve_rate()
+        
         self.setup_ui()
+        self.update_estimates()
         
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -40,7 +92,7 @@ class DiskInputDialog(QDialog):
         
         spinner_label = QLabel("Number of disks:")
         self.disk_spinner = QSpinBox()
-        self.disk_spinner.setRange(1, 8)
+        self.disk_spinner.setRange(1, self.MAX_DISKS)
         self.disk_spinner.setValue(3)
         self.disk_spinner.valueChanged.connect(self.on_spinner_changed)
         
@@ -50,6 +102,56 @@ class DiskInputDialog(QDialog):
         
         layout.addLayout(spinner_layout)
         
+        # Rules variant selection
+        variant_layout = QHBoxLayout()
+        variant_layout.addStretch()
+        
+        variant_label = QLabel("Rules:")
+        self.variant_combo = QComboBox()
+        for variant, label in self.VARIANTS:
+            self.variant_combo.addItem(label, variant)
+            
+        self.variant_combo.currentIndexChanged.connect(self.update_estimates)
+        
+        variant_layout.addWidget(variant_label)
+        variant_layout.addWidget(self.variant_combo)
+        variant_layout.addStretch()
+        
+        layout.addLayout(variant_layout)
+        
+        # Solution mode and the memory budget that guards eager mode
+        mode_layout = QHBoxLayout()
+        mode_layout.addStretch()
+        
+        mode_label = QLabel("Mode:")
+        self.mode_combo = QComboBox()
+        for mode, label in self.MODES:
+            self.mode_combo.addItem(label, mode)
+        self.mode_combo.activated.connect(self.on_mode_chosen)
+        
+        mode_layout.addWidget(mode_label)
+        mode_layout.addWidget(self.mode_combo)
+        mode_layout.addStretch()
+        
+        layout.addLayout(mode_layout)
+        
+        budget_layout = QHBoxLayout()
+        budget_layout.addStretch()
+        
+        budget_label = QLabel("Memory budget:")
+        self.budget_spinner = QSpinBox()
+        self.budget_spinner.setRange(16, 1 << 20)
+        self.budget_spinner.setSuffix(" MB")
+        self.budget_spinner.setValue(self.settings.value("memory_budget_mb",
+                                                         self.MEMORY_BUDGET_MB, type=int))
+        self.budget_spinner.valueChanged.connect(self.update_estimates)
+        
+        budget_layout.addWidget(budget_label)
+        budget_layout.addWidget(self.budget_spinner)
+        budget_layout.addStretch()
+        
+        layout.addLayout(budget_layout)
+        
         # Number buttons grid
         buttons_widget = QWidget()
         buttons_layout = QGridLayout(buttons_widget)
@@ -67,7 +169,7 @@ class DiskInputDialog(QDialog):
             row = 0 if i <= 4 else 1
             col = (i - 1) % 4
             buttons_layout.addWidget(button, row, col)
-        
+            
         # Set initial selection
         self.number_buttons[2].setChecked(True)  # Button for 3 disks
         
@@ -82,6 +184,12 @@ class DiskInputDialog(QDialog):
         self.selected_label.setFont(selected_font)
         layout.addWidget(self.selected_label)
         
+        # Predicted cost of the selection
+        self.estimate_label = QLabel()
+        self.estimate_label.setAlignment(Qt.AlignCenter)
+        self.estimate_label.setWordWrap(True)
+        layout.addWidget(self.estimate_label)
+        
         # OK and Cancel buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -117,10 +225,82 @@ class DiskInputDialog(QDialog):
         # Update button states
         for i, button in enumerate(self.number_buttons):
             button.setChecked(i + 1 == self.selected_disks)
-        
+            
         # Update label
         self.selected_label.setText(f"Selected: {self.selected_disks} disks")
+        self.update_estimates()
+        
+    def solve_rate(self):
+        """Return seconds per move of an eager solve on this machine.
+        
+        Measured once with a small solve and kept in QSettings; measured
+        again when the Python version changes.
+        """
+        rate = self.settings.value("estimator/solve_seconds_per_move", 0.0, type=float)
+        if rate <= 0 or self.settings.value("estimator/python", "") != sys.version:
+            rate = calibrate_solve_rate()
+            self.settings.setValue("estimator/solve_seconds_per_move", rate)
+            self.settings.setValue("estimator/python", sys.version)
+        return rate
+        
+    def on_mode_chosen(self, index):
+        """Keep a mode the user picked instead of auto-selecting"""
+        self.mode_chosen = True
+        self.update_estimates()
+        
+    def update_estimates(self):
+        """Show the predicted cost of the selection and guard eager mode.
+        
+        Eager mode is disabled when it would exceed the memory budget (or
+        the variant cannot be solved eagerly); the cheapest fitting mode is
+        then picked: indexed for classic, whose moves are closed-form, and
+        streaming for the variants, where forward play avoids a descent per
+        move.
+        """
+        if not hasattr(self, 'estimate_label'):
+            return
+        num_disks = self.selected_disks
+        variant = self.get_variant()
+        memory = estimate_memory(num_disks, variant)
+        total_moves = SOLVERS[variant](num_disks).total_moves
+        budget = self.budget_spinner.value() << 20
+        
+        eager_fits = memory['eager'] is not None and memory['eager'] <= budget
+        self.mode_combo.model().item(0).setEnabled(eager_fits)
+        if not self.mode_chosen or (self.get_mode() == 'eager' and not eager_fits):
+            fallback = 'indexed' if variant == 'classic' else 'streaming'
+            self.mode_combo.setCurrentIndex(
+                self.mode_combo.findData('eager' if eager_fits else fallback))
+                
+        eager_memory = format_bytes(memory['eager']) if memory['eager'] is not None else "n/a"
+        lines = [
+            f"Moves: {total_moves:,}",
+            f"Memory: eager {eager_memory}, streaming {format_bytes(memory['streaming'])}, "
+            f"indexed {format_bytes(memory['indexed'])}",
+        ]
+        if self.get_mode() == 'eager':
+            lines.append(f"Solve time: {format_duration(total_moves * self.seconds_per_move)}")
+        else:
+            lines.append("Solve time: none, moves are computed while playing")
+        lines.append(f"Full playback at {self.speed} ms/move: "
+                     f"{format_duration(total_moves * self.speed / 1000)}")
+        if memory['eager'] is not None and not eager_fits:
+            lines.append(f"Eager mode would exceed the {format_bytes(budget)} budget.")
+        self.estimate_label.setText("\n".join(lines))
         
     def get_disk_count(self):
         """Return the selected number of disks"""
         return self.selected_disks
+        
+    def get_variant(self):
+        """Return the selected rules variant"""
+        return self.variant_combo.currentData()
+        
+    def get_mode(self):
+        """Return the selected solution mode"""
+        return self.mode_combo.currentData()
+        
+    def accept(self):
+        """Remember the memory budget for next time"""
+        self.settings.setValue("memory_budget_mb", self.budget_spinner.value())
+        super().accept()
@@ -0,0 +1,61 @@
+"""
+Lightweight paint instrumentation for the Towers of Hanoi visualization.
+Collects per-frame timings so that replays and benchmarks can report them.
+"""
+
+from collections import deque
+
+
+class FrameStats:
+    """Accumulates paint timings for one widget"""
+    
+    # Recent frames kept for the percentile figure
+    MAX_SAMPLES = 10000
+    
+    def __init__(self):
+        # FrameCache of the widget, if any, whose figures are reported too
+        self.frame_cache = None
+        self.reset()
+        
+    def reset(self):
+        """Forget all recorded frames"""
+        if self.frame_cache is not None:
+            self.frame_cache.reset_counters()
+        self.frames = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples = deque(maxlen=self.MAX_SAMPLES)
+        
+    def record_frame(self, seconds):
+        """Record how long one paintEvent took"""
+        self.frames += 1
+        self.total_time += seconds
+        self.max_time = max(self.max_time, seconds)
+        self.samples.append(seconds)
+        
+    def summary(self):
+        """Return frame count and timing figures in milliseconds"""
+        if not self.frames:
+            return {'frames': 0, 'total_ms': 0.0, 'mean_ms': 0.0,
+                    'p95_ms': 0.0, 'max_ms': 0.0}
+        samples = sorted(self.samples)
+        return {
+            'frames': self.frames,
+            'total_ms': self.total_time * 1000,
+            'mean_ms': self.total_time * 1000 / self.frames,
+            'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000,
+            'max_ms': self.max_time * 1000,
+        }
+        
+    def report(self):
+        """Return the summary as printable lines"""
+        stats = self.summary()
+        lines = [
+            f"Frames painted: {stats['frames']}",
+            f"Paint time:     {stats['total_ms']:.1f} ms total, "
+            f"{stats['mean_ms']:.3f} ms mean, {stats['p95_ms']:.3f} ms p95, "
+            f"{stats['max_ms']:.3f} ms max",
+        ]
+        if self.frame_cache is not None:
+            lines.extend(self.frame_cache.report())
+        return lines
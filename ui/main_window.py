@@ -1,16 +1,38 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QMenuBar, QToolBar, QPushButton, QSlider, QLabel, 
-                             QStatusBar, QMessageBox, QSizePolicy)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QKeySequence, QIcon
+                             QStatusBar, QMessageBox, QSizePolicy, QInputDialog,
+                             QFileDialog)
+from PySide6.QtCore import Qt, QTimer, QEvent, QSettings
+from PySide6.QtGui import QAction, QActionGroup, QKeySequence, QIcon
 
+from hanoi import SOLVERS
 from .hanoi_widget import HanoiWidget
+from .comparison_view import ComparisonView
+from .timeline import TimelineMinimap
+from .coalescing import StatusModel
+from .solution_client import SolutionClient
 from .input_dialog import DiskInputDialog
 from .theme_manager import ThemeManager
+from .session_recorder import (SessionRecorder, SPEED_CHANGE, NEW_GAME,
+                               THEME_CHANGE, SEEK, PLAY_PAUSE, STEP, RESET,
+                               MANUAL_MODE)
 
 
 class HanoiMainWindow(QMainWindow):
-    def __init__(self):
+    # Disks listed in the status bar's per-disk move counts
+    MAX_DISK_COUNTS_SHOWN = 10
+    
+    # Default back-step frame cache budget, overridden by the
+    # "frame_cache_mb" setting. Off unless asked for: forward playback never
+    # hits the cache but would still pay for filling it
+    FRAME_CACHE_MB = 0
+    
+    # Renderer backends offered in View > Renderer, saved as the "renderer"
+    # setting
+    RENDERERS = (('painter', "&Painter (immediate)"),
+                 ('scene', "&Graphics Scene (retained)"))
+                 
+    def __init__(self, num_disks=None, variant='classic', mode='eager'):
         super().__init__()
         self.setWindowTitle("Towers of Hanoi Visualization")
         self.setMinimumSize(1000, 700)
@@ -22,8 +44,22 @@ class HanoiMainWindow(QMainWindow):
         # Apply the current theme
         self.theme_manager.apply_theme()
         
-        # Initialize with default or get from dialog
-        self.num_disks = self.get_disk_input()
+        # Optional side-by-side comparison window
+        self.comparison_view = None
+        
+        # Active session recorder, if any
+        self.recorder = None
+        
+        # Connection to a shared playback server, if any, and its state
+        self.client = None
+        self.remote_playing = False
+        
+        # Rules variant and solution mode, updated by the disk input dialog
+        self.variant = variant
+        self.mode = mode
+        
+        # Initialize with the given disk count or get from dialog
+        self.num_disks = num_disks if num_disks is not None else self.get_disk_input()
         if self.num_disks is None:
             self.close()
             return
@@ -45,9 +81,12 @@ class HanoiMainWindow(QMainWindow):
             print(f"Could not load stylesheet: {e}")
         
     def get_disk_input(self):
-        """Show input dialog to get number of disks"""
-        dialog = DiskInputDialog(self)
+        """Show input dialog to get number of disks and the rules variant"""
+        speed = self.speed_slider.value() if hasattr(self, 'speed_slider') else 500
+        dialog = DiskInputDialog(self, speed)
         if dialog.exec() == DiskInputDialog.Accepted:
+            self.variant = dialog.get_variant()
+            self.mode = dialog.get_mode()
             return dialog.get_disk_count()
         return None
         
@@ -62,15 +101,33 @@ class HanoiMainWindow(QMainWindow):
         main_layout.setContentsMargins(10, 10, 10, 10)
         
         # Create the Hanoi visualization widget
-        self.hanoi_widget = HanoiWidget(self.num_disks, self)
+        frame_cache_mb = QSettings().value("frame_cache_mb", self.FRAME_CACHE_MB, type=int)
+        self.hanoi_widget = HanoiWidget(self.num_disks, self, variant=self.variant,
+                                        frame_cache_budget=frame_cache_mb << 20,
+                                        mode=self.mode,
+                                        backend=self.saved_renderer())
         self.hanoi_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         # Enable focus to receive keyboard events
         self.hanoi_widget.setFocusPolicy(Qt.StrongFocus)
         self.hanoi_widget.setFocus()
+        self.hanoi_widget.manual_move_made.connect(self.on_manual_move)
+        self.hanoi_widget.illegal_move_attempted.connect(self.on_illegal_move)
+        
+        # Route the widget's key presses through keyPressEvent below
+        self.hanoi_widget.installEventFilter(self)
+        
+        # Labels follow the widget's signals, refreshed at most once a frame
+        self.status_model = StatusModel(self.hanoi_widget, self)
+        self.status_model.changed.connect(self.refresh_status)
         
         main_layout.addWidget(self.hanoi_widget)
         
+        # Whole-solution timeline with click-to-seek
+        self.timeline = TimelineMinimap(self.hanoi_widget)
+        self.timeline.seek_requested.connect(self.seek_to)
+        main_layout.addWidget(self.timeline)
+        
         # Control panel
         control_panel = self.create_control_panel()
         main_layout.addWidget(control_panel)
@@ -129,6 +186,20 @@ class HanoiMainWindow(QMainWindow):
         
         file_menu.addSeparator()
         
+        self.record_action = QAction("Start &Recording", self)
+        self.record_action.setStatusTip("Record input for deterministic replay (see replay.py)")
+        self.record_action.triggered.connect(self.toggle_recording)
+        file_menu.addAction(self.record_action)
+        
+        file_menu.addSeparator()
+        
+        self.connect_action = QAction("&Connect to Server...", self)
+        self.connect_action.setStatusTip("Follow a shared playback server (see solution_server.py)")
+        self.connect_action.triggered.connect(self.toggle_connection)
+        file_menu.addAction(self.connect_action)
+        
+        file_menu.addSeparator()
+        
         exit_action = QAction("E&xit", self)
         exit_action.setShortcut(QKeySequence.Quit)
         exit_action.setStatusTip("Exit the application")
@@ -143,29 +214,57 @@ class HanoiMainWindow(QMainWindow):
         reset_view_action.triggered.connect(self.reset_animation)
         view_menu.addAction(reset_view_action)
         
+        self.manual_mode_action = QAction("&Manual Play", self)
+        self.manual_mode_action.setShortcut("Ctrl+M")
+        self.manual_mode_action.setStatusTip("Drag disks yourself with optimal-move hints")
+        self.manual_mode_action.setCheckable(True)
+        self.manual_mode_action.toggled.connect(self.set_manual_mode)
+        view_menu.addAction(self.manual_mode_action)
+        
+        state_graph_action = QAction("State &Graph", self)
+        state_graph_action.setStatusTip("Show the configuration on the Sierpinski state graph")
+        state_graph_action.setCheckable(True)
+        state_graph_action.setChecked(True)
+        state_graph_action.toggled.connect(self.hanoi_widget.set_show_state_graph)
+        view_menu.addAction(state_graph_action)
+        
+        timeline_action = QAction("&Timeline", self)
+        timeline_action.setStatusTip("Show the whole solution as a seekable strip")
+        timeline_action.setCheckable(True)
+        timeline_action.setChecked(True)
+        timeline_action.toggled.connect(self.timeline.setVisible)
+        view_menu.addAction(timeline_action)
+        
+        compare_action = QAction("&Compare Disk Counts...", self)
+        compare_action.setStatusTip("Play several disk counts side by side")
+        compare_action.triggered.connect(self.show_comparison)
+        view_menu.addAction(compare_action)
+        
+        frame_cache_action = QAction("&Frame Cache Budget...", self)
+        frame_cache_action.setStatusTip("Memory kept for instant stepping back")
+        frame_cache_action.triggered.connect(self.configure_frame_cache)
+        view_menu.addAction(frame_cache_action)
+        
+        # Renderer submenu, immediate QPainter or retained QGraphicsScene
+        renderer_menu = view_menu.addMenu("&Renderer")
+        renderer_group = QActionGroup(self)
+        self.renderer_actions = {}
+        for backend, label in self.RENDERERS:
+            action = QAction(label, self)
+            action.setCheckable(True)
+            action.setChecked(backend == self.hanoi_widget.backend)
+            action.triggered.connect(lambda checked, b=backend: self.set_renderer(b))
+            renderer_group.addAction(action)
+            renderer_menu.addAction(action)
+            self.renderer_actions[backend] = action
+            
         view_menu.addSeparator()
         
-        # Theme submenu
-        theme_menu = view_menu.addMenu("&Theme")
-        
-        light_theme_action = QAction("&Light Theme", self)
-        light_theme_action.setStatusTip("Switch to light theme")
-        light_theme_action.setCheckable(True)
-        light_theme_action.triggered.connect(lambda: self.set_theme(ThemeManager.LIGHT_THEME))
-        theme_menu.addAction(light_theme_action)
-        
-        dark_theme_action = QAction("&Dark Theme", self)
-        dark_theme_action.setStatusTip("Switch to dark theme")
-        dark_theme_action.setCheckable(True)
-        dark_theme_action.triggered.connect(lambda: self.set_theme(ThemeManager.DARK_THEME))
-        theme_menu.addAction(dark_theme_action)
-        
-        # Store theme actions for updating checkmarks
-        self.light_theme_action = light_theme_action
-        self.dark_theme_action = dark_theme_action
-        
-        # Set initial checkmarks
-        self.update_theme_menu_checkmarks()
+        # Theme submenu, one entry per registered theme
+        self.theme_menu = view_menu.addMenu("&Theme")
+        self.theme_action_group = QActionGroup(self)
+        self.theme_actions = {}
+        self.populate_theme_menu()
         
         toggle_theme_action = QAction("Toggle &Theme", self)
         toggle_theme_action.setShortcut("Ctrl+T")
@@ -219,8 +318,10 @@ class HanoiMainWindow(QMainWindow):
         # Add permanent widgets to status bar
         self.move_label = QLabel("Move: 0/0")
         self.status_label = QLabel("Ready")
+        self.disk_moves_label = QLabel()
         
         self.status_bar.addWidget(self.move_label)
+        self.status_bar.addWidget(self.disk_moves_label)
         self.status_bar.addPermanentWidget(self.status_label)
         
         # Update status bar initially
@@ -228,46 +329,110 @@ class HanoiMainWindow(QMainWindow):
         
     def toggle_playback(self):
         """Toggle between play and pause"""
+        if self.client is not None:
+            self.client.send({'type': 'pause' if self.remote_playing else 'play'})
+            return
+        self.record_event(PLAY_PAUSE)
         self.hanoi_widget.toggle_autoplay()
-        self.update_play_button()
-        self.update_status_bar()
         
     def step_back(self):
         """Step back one move"""
+        if self.client is not None:
+            self.client.send({'type': 'step', 'delta': -1})
+            return
+        self.record_event(STEP, -1)
         self.hanoi_widget.previous_move()
-        self.update_status_bar()
         
     def step_forward(self):
         """Step forward one move"""
+        if self.client is not None:
+            self.client.send({'type': 'step', 'delta': 1})
+            return
+        self.record_event(STEP, 1)
         self.hanoi_widget.next_move()
-        self.update_status_bar()
         
     def reset_animation(self):
         """Reset the animation to initial state"""
+        if self.client is not None:
+            self.client.send({'type': 'seek', 'move': 0})
+            return
+        self.record_event(RESET)
         self.hanoi_widget.reset_animation()
-        self.update_play_button()
-        self.update_status_bar()
+        
+    def seek_to(self, index):
+        """Jump to a move picked on the timeline"""
+        if self.hanoi_widget.manual_mode:
+            return
+        if self.client is not None:
+            self.client.send({'type': 'seek', 'move': index})
+            return
+        self.record_event(SEEK, index)
+        self.hanoi_widget.seek(index)
         
     def on_speed_changed(self, value):
         """Handle speed slider change"""
+        self.record_event(SPEED_CHANGE, value)
         self.hanoi_widget.set_animation_speed(value)
         self.speed_value_label.setText(f"{value}ms")
+        if self.client is not None:
+            self.client.send({'type': 'speed', 'ms': value})
+            
+    def refresh_status(self):
+        """Bring the play button and status bar up to date"""
+        self.update_play_button()
+        self.update_status_bar()
         
     def update_play_button(self):
         """Update the play/pause button text"""
-        if self.hanoi_widget.auto_play:
+        if self.hanoi_widget.auto_play or (self.client is not None and self.remote_playing):
             self.play_pause_btn.setText("Pause")
         else:
             self.play_pause_btn.setText("Play")
             
+    def set_manual_mode(self, enabled):
+        """Switch the visualization between playback and manual play"""
+        self.record_event(MANUAL_MODE, int(enabled))
+        self.hanoi_widget.set_manual_mode(enabled)
+        for button in (self.play_pause_btn, self.step_back_btn, self.step_forward_btn):
+            button.setEnabled(not enabled)
+        self.update_play_button()
+        self.update_status_bar()
+        
+    def on_manual_move(self, source, target, disk):
+        """Handle a legal move made by dragging a disk"""
+        self.update_status_bar()
+        
+    def on_illegal_move(self, reason):
+        """Show why a dropped disk was rejected"""
+        self.status_bar.showMessage(reason, 2000)
+        
     def update_status_bar(self):
         """Update the status bar information"""
-        total_moves = len(self.hanoi_widget.solver.moves)
+        if self.hanoi_widget.manual_mode:
+            remaining = self.hanoi_widget.optimal_moves_remaining()
+            self.move_label.setText(f"Moves: {self.hanoi_widget.manual_moves} | "
+                                    f"Optimal remaining: {remaining}")
+            self.status_label.setText("Solved" if remaining == 0 else "Manual play")
+            self.disk_moves_label.clear()
+            return
+            
+        solver = self.hanoi_widget.solver
+        total_moves = solver.total_moves
         current_move = self.hanoi_widget.current_move
         
         self.move_label.setText(f"Move: {current_move}/{total_moves}")
         
-        if self.hanoi_widget.auto_play:
+        # Per-disk counts come from the solution's structure, not a rescan
+        counts = solver.disk_move_counts(0, current_move)
+        shown = " ".join(f"{disk}:{count}" for disk, count
+                         in enumerate(counts[:self.MAX_DISK_COUNTS_SHOWN], 1))
+        if len(counts) > self.MAX_DISK_COUNTS_SHOWN:
+            shown += " …"
+        self.disk_moves_label.setText(f"Disk moves: {shown}")
+        
+        if self.client is not None:
+            self.status_label.setText("Server: playing" if self.remote_playing else "Server: paused")
+        elif self.hanoi_widget.auto_play:
             self.status_label.setText("Playing")
         elif current_move == total_moves:
             self.status_label.setText("Completed")
@@ -278,27 +443,182 @@ class HanoiMainWindow(QMainWindow):
         """Start a new game with possibly different number of disks"""
         num_disks = self.get_disk_input()
         if num_disks is not None:
-            self.num_disks = num_disks
-            # Create new hanoi widget with new disk count
-            old_widget = self.hanoi_widget
-            self.hanoi_widget = HanoiWidget(self.num_disks, self)
-            self.hanoi_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            self.hanoi_widget.setFocusPolicy(Qt.StrongFocus)
-            self.hanoi_widget.setFocus()
+            self.start_game(num_disks, self.variant, self.mode)
+            
+    def start_game(self, num_disks, variant='classic', mode='eager'):
+        """Load a puzzle with the given number of disks, rules and mode"""
+        self.record_event(NEW_GAME, num_disks, variant, mode)
+        self.num_disks = num_disks
+        self.variant = variant
+        self.mode = mode
+        # Load the new puzzle into the existing widget
+        self.hanoi_widget.load_puzzle(self.num_disks, self.variant, self.mode)
+        self.hanoi_widget.setFocus()
+        
+        # Update UI
+        self.update_play_button()
+        self.update_status_bar()
+        
+    def toggle_recording(self):
+        """Start recording input, or stop and save the recording"""
+        if self.recorder is None:
+            self.recorder = SessionRecorder(self)
+            self.record_action.setText("Stop &Recording...")
+            self.status_bar.showMessage("Recording session", 2000)
+            return
             
-            # Replace in layout
-            central_widget = self.centralWidget()
-            layout = central_widget.layout()
-            layout.replaceWidget(old_widget, self.hanoi_widget)
-            old_widget.deleteLater()
+        recorder = self.recorder
+        self.recorder = None
+        recorder.stop()
+        self.record_action.setText("Start &Recording")
+        path, _ = QFileDialog.getSaveFileName(self, "Save Session", "session.json",
+                                              "Session logs (*.json)")
+        if path:
+            try:
+                recorder.save(path)
+            except OSError as e:
+                QMessageBox.warning(self, "Save Session", f"Could not save session: {e}")
+                
+    def record_event(self, kind, *args):
+        """Add an event to the active recording, if any"""
+        if self.recorder is not None:
+            self.recorder.record(kind, *args)
             
-            # Update UI
-            self.update_play_button()
-            self.update_status_bar()
+    def show_comparison(self):
+        """Open a grid of synchronised panes for several disk counts"""
+        text, ok = QInputDialog.getText(self, "Compare Disk Counts",
+                                        "Disk counts, optionally with rules "
+                                        "(e.g. 3, 4, 4:cyclic, 4:adjacent):",
+                                        text="3, 4, 4:cyclic, 4:adjacent")
+        if not ok:
+            return
+        puzzles = []
+        try:
+            for part in text.split(','):
+                if not part.strip():
+                    continue
+                count, _, variant = part.partition(':')
+                variant = variant.strip() or 'classic'
+                if variant not in SOLVERS:
+                    raise ValueError(variant)
+                if 1 <= int(count) <= 8:
+                    puzzles.append((int(count), variant))
+        except ValueError:
+            QMessageBox.warning(self, "Compare Disk Counts",
+                                "Please enter whole numbers separated by commas, "
+                                f"with optional rules: {', '.join(SOLVERS)}.")
+            return
+        if not puzzles:
+            return
             
-            # Apply theme to new widget
-            self.hanoi_widget.update_theme_colors()
+        if self.comparison_view is not None:
+            self.comparison_view.destroyed.disconnect(self.on_comparison_destroyed)
+            self.comparison_view.close()
+        self.comparison_view = ComparisonView(puzzles, self.theme_manager)
+        self.comparison_view.destroyed.connect(self.on_comparison_destroyed)
+        self.comparison_view.resize(1200, 800)
+        self.comparison_view.show()
+        
+    def on_comparison_destroyed(self):
+        """Forget the closed comparison view so its solutions are released"""
+        self.comparison_view = None
+        
+    def configure_frame_cache(self):
+        """Ask for the frame cache budget and remember it"""
+        current = self.hanoi_widget.frame_cache.budget_bytes >> 20
+        budget_mb, ok = QInputDialog.getInt(self, "Frame Cache Budget",
+                                            "Megabytes of recent frames kept for "
+                                            "stepping back (0 turns the cache off):",
+                                            current, 0, 4096)
+        if ok:
+            QSettings().setValue("frame_cache_mb", budget_mb)
+            self.hanoi_widget.set_frame_cache_budget(budget_mb << 20)
             
+    def saved_renderer(self):
+        """Return the renderer backend chosen last time"""
+        backend = QSettings().value("renderer", 'painter')
+        return backend if backend in HanoiWidget.BACKENDS else 'painter'
+        
+    def set_renderer(self, backend):
+        """Switch the renderer backend and remember it"""
+        QSettings().setValue("renderer", backend)
+        self.hanoi_widget.set_backend(backend)
+        self.renderer_actions[backend].setChecked(True)
+        
+    def toggle_connection(self):
+        """Connect to a playback server, or leave client mode"""
+        if self.client is not None:
+            self.client.disconnect_from_server()
+            return
+        text, ok = QInputDialog.getText(self, "Connect to Server", "Server address (host:port):",
+                                        text="127.0.0.1:8765")
+        if not ok:
+            return
+        host, _, port = text.strip().rpartition(':')
+        try:
+            self.connect_to_server(host or "127.0.0.1", int(port))
+        except ValueError:
+            QMessageBox.warning(self, "Connect to Server", f"Invalid address: {text}")
+            
+    def connect_to_server(self, host, port):
+        """Enter client mode: playback follows the server at host:port"""
+        if self.hanoi_widget.auto_play:
+            self.hanoi_widget.toggle_autoplay()
+        self.manual_mode_action.setChecked(False)
+        self.manual_mode_action.setEnabled(False)
+        self.client = SolutionClient(self)
+        self.client.snapshot_received.connect(self.on_snapshot)
+        self.client.move_received.connect(self.on_remote_move)
+        self.client.state_received.connect(self.on_remote_state)
+        self.client.disconnected.connect(self.on_disconnected)
+        self.client.error.connect(self.on_connection_error)
+        self.client.connect_to(host, port)
+        self.connect_action.setText("Dis&connect from Server")
+        self.status_bar.showMessage(f"Connecting to {host}:{port}...", 3000)
+        
+    def on_snapshot(self, snapshot):
+        """Take over the server's puzzle and position"""
+        num_disks, variant = snapshot['num_disks'], snapshot['variant']
+        if (num_disks, variant) != (self.num_disks, self.variant):
+            self.num_disks, self.variant, self.mode = num_disks, variant, 'indexed'
+            self.hanoi_widget.load_puzzle(num_disks, variant, 'indexed')
+        self.hanoi_widget.show_position(snapshot['move'], snapshot['positions'])
+        self.on_remote_state(snapshot['playing'], snapshot['speed'])
+        
+    def on_remote_move(self, delta, source, target):
+        """Apply a move broadcast by the server"""
+        if not self.hanoi_widget.apply_move(delta, source, target):
+            self.client.send({'type': 'snapshot'})
+            
+    def on_remote_state(self, playing, speed):
+        """Follow the server's play state and speed"""
+        self.remote_playing = playing
+        self.speed_slider.blockSignals(True)
+        self.speed_slider.setValue(speed)
+        self.speed_slider.blockSignals(False)
+        self.speed_value_label.setText(f"{speed}ms")
+        self.refresh_status()
+        
+    def on_disconnected(self):
+        """Leave client mode when the server closes the connection"""
+        self.leave_client_mode("Disconnected from server")
+        
+    def on_connection_error(self, message):
+        """Report a connection problem and leave client mode"""
+        self.leave_client_mode(f"Server connection: {message}")
+        
+    def leave_client_mode(self, message):
+        """Drop the connection, keeping the last position shown"""
+        if self.client is None:
+            return
+        self.client.deleteLater()
+        self.client = None
+        self.remote_playing = False
+        self.connect_action.setText("&Connect to Server...")
+        self.manual_mode_action.setEnabled(True)
+        self.status_bar.showMessage(message, 5000)
+        self.refresh_status()
+        
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(self, "About Towers of Hanoi",
@@ -311,13 +631,36 @@ class HanoiMainWindow(QMainWindow):
                          "• Right Arrow: Next move\\n\\n"
                          "Built with PySide6")
                          
+    def eventFilter(self, watched, event):
+        """Send key presses on the hanoi widget through keyPressEvent and
+        record its key releases"""
+        if (watched is self.hanoi_widget and event.type() == QEvent.KeyRelease
+                and self.recorder is not None):
+            self.recorder.record_key(event)
+        if watched is self.hanoi_widget and event.type() == QEvent.KeyPress:
+            self.keyPressEvent(event)
+            # Already handled here, don't let it propagate back up to us
+            event.accept()
+            return True
+        return super().eventFilter(watched, event)
+        
     def keyPressEvent(self, event):
         """Handle global keyboard shortcuts"""
-        # Forward to hanoi widget for visualization controls
+        if self.recorder is not None:
+            self.recorder.record_key(event)
+        # In client mode the server owns playback, send it the command
+        if self.client is not None:
+            if event.key() == Qt.Key_Space:
+                self.toggle_playback()
+            elif event.key() == Qt.Key_Right:
+                self.step_forward()
+            elif event.key() == Qt.Key_Left:
+                self.step_back()
+            super().keyPressEvent(event)
+            return
+        # Forward to hanoi widget for visualization controls; the status
+        # model picks up whatever changed
         self.hanoi_widget.keyPressEvent(event)
-        # Update UI after key press
-        self.update_play_button()
-        self.update_status_bar()
         super().keyPressEvent(event)
         
     def closeEvent(self, event):
@@ -325,6 +668,8 @@ class HanoiMainWindow(QMainWindow):
         # Stop any running timers
         if hasattr(self.hanoi_widget, 'timer'):
             self.hanoi_widget.timer.stop()
+        if self.comparison_view is not None:
+            self.comparison_view.close()
         event.accept()
         
     def set_theme(self, theme):
@@ -333,6 +678,8 @@ class HanoiMainWindow(QMainWindow):
         
     def on_theme_changed(self, theme):
         """Handle theme change"""
+        self.record_event(THEME_CHANGE, theme)
+        
         # Update menu checkmarks
         self.update_theme_menu_checkmarks()
         
@@ -340,9 +687,51 @@ class HanoiMainWindow(QMainWindow):
         if hasattr(self, 'hanoi_widget'):
             self.hanoi_widget.update_theme_colors()
             self.hanoi_widget.update()  # Force repaint
+            self.timeline.update()
+        if self.comparison_view is not None:
+            self.comparison_view.update_theme_colors()
+        
+    def populate_theme_menu(self):
+        """Fill the theme submenu from the theme manager's registry"""
+        self.theme_menu.clear()
+        for action in self.theme_actions.values():
+            self.theme_action_group.removeAction(action)
+        self.theme_actions = {}
+        
+        for name, theme in self.theme_manager.themes.items():
+            action = QAction(f"{theme.label} Theme", self)
+            action.setStatusTip(f"Switch to {theme.label.lower()} theme")
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, name=name: self.set_theme(name))
+            self.theme_action_group.addAction(action)
+            self.theme_menu.addAction(action)
+            self.theme_actions[name] = action
+            
+        self.theme_menu.addSeparator()
+        load_theme_action = QAction("&Load Theme File...", self)
+        load_theme_action.setStatusTip("Load a user-defined theme from a JSON file")
+        load_theme_action.triggered.connect(self.load_theme_file)
+        self.theme_menu.addAction(load_theme_action)
+        
+        # Set initial checkmarks
+        self.update_theme_menu_checkmarks()
+        
+    def load_theme_file(self):
+        """Register a user theme from a file and switch to it"""
+        path, _ = QFileDialog.getOpenFileName(self, "Load Theme", "",
+                                              "Theme files (*.json)")
+        if not path:
+            return
+        try:
+            name = self.theme_manager.load_theme_file(path)
+        except (OSError, ValueError, KeyError) as e:
+            QMessageBox.warning(self, "Load Theme", f"Could not load theme: {e}")
+            return
+        self.populate_theme_menu()
+        self.set_theme(name)
         
     def update_theme_menu_checkmarks(self):
         """Update the checkmarks in the theme menu"""
         current_theme = self.theme_manager.get_current_theme()
-        self.light_theme_action.setChecked(current_theme == ThemeManager.LIGHT_THEME)
-        self.dark_theme_action.setChecked(current_theme == ThemeManager.DARK_THEME)
+        for name, action in self.theme_actions.items():
+            action.setChecked(name == current_theme)
@@ -0,0 +1,98 @@
+"""
+Render cache for the Towers of Hanoi visualization.
+Holds fonts, pre-laid-out text and tower geometry so that several
+HanoiWidget panes can share them instead of rebuilding them per widget.
+"""
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QFontMetrics, QStaticText
+
+from .state_graph import StateGraphRenderer
+from .timeline import TimelineRenderer
+
+
+class RenderCache:
+    """Fonts, glyph layouts and geometry shared between HanoiWidget panes"""
+    
+    MAX_LAYOUTS = 64
+    
+    _shared = None
+    
+    @classmethod
+    def shared(cls):
+        """Return the process-wide cache used when a widget is given none"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+        
+    def __init__(self):
+        self.font = QFont('Arial', 12)
+        self.code_font = QFont('Courier', 10)
+        self.title_font = QFont('Arial', 14, QFont.Bold)
+        self._ascents = {}
+        self._static_texts = {}
+        self._layouts = {}
+        
+        # Mipmapped state graph images and sampled solution paths
+        self.state_graph = StateGraphRenderer()
+        
+        # Multi-resolution timeline overviews
+        self.timeline = TimelineRenderer()
+        
+    def ascent(self, font):
+        """Return the ascent of the given font, used to place static text"""
+        key = font.key()
+        if key not in self._ascents:
+            self._ascents[key] = QFontMetrics(font).ascent()
+        return self._ascents[key]
+        
+    def static_text(self, text, font):
+        """Return a QStaticText with its glyph layout prepared for font"""
+        key = (text, font.key())
+        static_text = self._static_texts.get(key)
+        if static_text is None:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.PlainText)
+            static_text.prepare(font=font)
+            self._static_texts[key] = static_text
+        return static_text
+        
+    def tower_layout(self, width, height, num_disks):
+        """Return the tower and disk geometry for a drawing area.
+        
+        The result is (start_x, start_y, tower_width, tower_height,
+        peg_positions, disk_widths, disk_height) where disk_widths[d - 1] is
+        the width of disk d. Disks shrink only when they would not fit.
+        """
+        key = (width, height, num_disks)
+        layout = self._layouts.get(key)
+        if layout is None:
+            if len(self._layouts) >= self.MAX_LAYOUTS:
+                self._layouts.clear()
+            layout = self._compute_layout(width, height, num_disks)
+            self._layouts[key] = layout
+        return layout
+        
+    def _compute_layout(self, width, height, num_disks):
+        tower_width = width * 0.8
+        tower_height = height * 0.6
+        tower_start_x = (width - tower_width) // 2
+        tower_start_y = height * 0.2
+        peg_positions = [
+            tower_start_x + tower_width * 0.2,
+            tower_start_x + tower_width * 0.5,
+            tower_start_x + tower_width * 0.8
+        ]
+        
+        # Keep the classic 30 + 25 * disk sizing unless the pane is too small
+        base_width = min(30, tower_width * 0.1)
+        unit = 25
+        if num_disks:
+            unit = max(1, min(unit, (tower_width * 0.5 - base_width) / num_disks))
+            disk_height = max(2, min(20, (tower_height - 40) / num_disks - 2))
+        else:
+            disk_height = 20
+        disk_widths = [int(base_width + disk * unit) for disk in range(1, num_disks + 1)]
+        
+        return (tower_start_x, tower_start_y, tower_width, tower_height,
+                peg_positions, disk_widths, int(disk_height))
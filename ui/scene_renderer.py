@@ -0,0 +1,162 @@
+"""
+Retained-mode renderer backend for HanoiWidget.
+
+Instead of repainting the whole widget through QPainter every frame, the
+picture is kept in a QGraphicsScene shown by a QGraphicsView laid over the
+widget. Every disk is a persistent item cached in device coordinates, so a
+move repositions one item and the view blits its cached pixmap; the static
+towers are cached the same way. The side panels and the controls readout
+change every move and are items that reuse the widget's draw methods
+without caching. The scene keeps its BSP index so the view only visits the
+items under the exposed region.
+
+Manual play needs the drag and hover feedback of the painter path, so the
+widget falls back to it while manual mode is on.
+"""
+
+import time
+
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView, QFrame
+from PySide6.QtCore import Qt, QRect, QRectF
+from PySide6.QtGui import QPainter, QBrush
+
+
+class PaintItem(QGraphicsItem):
+    """A fixed area of the widget drawn by one of its draw methods"""
+    
+    def __init__(self, rect, paint, cache_mode=QGraphicsItem.NoCache):
+        super().__init__()
+        self.rect = QRectF(rect)
+        self.paint_area = paint
+        self.setCacheMode(cache_mode)
+        
+    def boundingRect(self):
+        return self.rect
+        
+    def paint(self, painter, option, widget=None):
+        # The view skips saving painter state, so the clip is undone here
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setClipRect(self.rect)
+        self.paint_area(painter)
+        painter.restore()
+
+
+class DiskItem(QGraphicsItem):
+    """One disk, painted once into the item cache and moved by position"""
+    
+    def __init__(self, hanoi_widget, disk, width, height):
+        super().__init__()
+        self.hanoi_widget = hanoi_widget
+        self.disk = disk
+        # Room for the outline pen around the disk
+        self.rect = QRectF(-2, -2, width + 4, height + 4)
+        self.disk_rect = QRect(0, 0, width, height)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
+    def boundingRect(self):
+        return self.rect
+        
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing)
+        self.hanoi_widget.draw_disk(painter, self.disk_rect, self.disk)
+
+
+class SceneView(QGraphicsView):
+    """View over the whole widget that reports its paint time"""
+    
+    def __init__(self, scene, hanoi_widget):
+        super().__init__(scene, hanoi_widget)
+        self.hanoi_widget = hanoi_widget
+        self.setFrameShape(QFrame.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        # Input stays with the widget, which owns keyboard and mouse handling
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.hanoi_widget.frame_stats.record_frame(time.perf_counter() - start)
+
+
+class SceneRenderer:
+    """Keeps a HanoiWidget's picture in a QGraphicsScene"""
+    
+    def __init__(self, hanoi_widget):
+        self.widget = hanoi_widget
+        self.scene = QGraphicsScene(hanoi_widget)
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.view = SceneView(self.scene, hanoi_widget)
+        self.disk_items = []
+        self.slots = []
+        self.dynamic_items = []
+        hanoi_widget.move_changed.connect(self.sync)
+        hanoi_widget.playback_toggled.connect(self.sync)
+        
+    @property
+    def active(self):
+        return self.view.isVisible()
+        
+    def rebuild(self):
+        """Recreate every item after a resize, theme or puzzle change"""
+        widget = self.widget
+        width, height = widget.width(), widget.height()
+        viz_width, viz_height = widget.viz_size()
+        
+        self.scene.clear()
+        self.scene.setSceneRect(0, 0, width, height)
+        self.scene.setBackgroundBrush(QBrush(widget.bg_color))
+        self.view.setGeometry(0, 0, width, height)
+        
+        towers = PaintItem(QRectF(0, 0, viz_width, viz_height),
+                           lambda painter: widget.draw_towers(painter, viz_width, viz_height),
+                           QGraphicsItem.DeviceCoordinateCache)
+        self.scene.addItem(towers)
+        
+        disk_widths, disk_height = widget.render_cache.tower_layout(
+            viz_width, viz_height, widget.num_disks)[5:]
+        self.disk_items = []
+        for disk in range(1, widget.num_disks + 1):
+            item = DiskItem(widget, disk, disk_widths[disk - 1], disk_height)
+            item.setZValue(1)
+            self.scene.addItem(item)
+            self.disk_items.append(item)
+        self.slots = [None] * widget.num_disks
+        
+        self.dynamic_items = [PaintItem(QRectF(0, height - 70, viz_width, 70),
+                                        lambda painter: widget.draw_controls(
+                                            painter, 20, height - 60, viz_width - 40, 40))]
+        if width > 800:
+            self.dynamic_items.append(PaintItem(QRectF(viz_width, 0, width - viz_width, viz_height),
+                                                widget.draw_side_panels))
+        for item in self.dynamic_items:
+            self.scene.addItem(item)
+        self.sync()
+        
+    def sync(self, *args):
+        """Move the disk items that changed place and refresh the panels"""
+        widget = self.widget
+        if len(self.slots) != widget.num_disks:
+            # A new puzzle is loading; rebuild() follows
+            return
+        viz_width, viz_height = widget.viz_size()
+        for peg, tower in widget.towers.items():
+            for level, disk in enumerate(tower.disks):
+                if self.slots[disk - 1] != (peg, level):
+                    self.slots[disk - 1] = (peg, level)
+                    rect = widget.disk_rect(viz_width, viz_height, peg, level, disk)
+                    self.disk_items[disk - 1].setPos(rect.x(), rect.y())
+        for item in self.dynamic_items:
+            item.update()
+            
+    def close(self):
+        self.widget.move_changed.disconnect(self.sync)
+        self.widget.playback_toggled.disconnect(self.sync)
+        self.view.deleteLater()
+        self.scene.deleteLater()
@@ -0,0 +1,212 @@
+"""
+Session recording and deterministic playback for the Towers of Hanoi
+application.
+
+SessionRecorder captures the input stream of a HanoiMainWindow (key presses
+and releases, speed slider changes, new games, theme switches, timeline
+seeks, and the play/pause, step, reset and manual-mode commands of the
+buttons, toolbar and menus) with millisecond timestamps. SessionPlayer
+re-injects a recorded stream either at the recorded pace or as fast as
+possible; in the latter case autoplay is driven by a virtual clock so the
+replay stays deterministic.
+
+Log format (JSON):
+
+    {"version": 1, "num_disks": 3, "variant": "classic", "mode": "eager",
+     "speed": 500, "theme": "light", "size": [1200, 800],
+     "events": [[12, "k", 16777236, 0, 0, 5310], [40, "r", 16777236, 0, 0, 5338],
+                [340, "s", 250],
+                [900, "n", 5, "classic", "eager"], [1500, "t", "dark"], [1700, "j", 12],
+                [1800, "p"], [1900, "m", -1], [1950, "z"], [1990, "u", 1],
+                [2000, "e"]]}
+
+Event kinds: "k" key press and "r" key release (key, modifiers, auto-repeat
+flag, the event's own timestamp in ms), "s" speed slider value, "n" new game
+(disk count, variant, mode), "t" theme name, "j" timeline seek (move index),
+"p" play/pause, "m" step (+1 or -1), "z" reset, "u" manual mode (1 on,
+0 off), "e" end of recording. Replayed key events get their recorded
+timestamp back, which is what the hold-to-fast-forward ramp is timed with.
+Older logs without these fields replay as plain presses.
+"""
+
+import json
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal, QEvent, Qt
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QApplication
+
+
+LOG_VERSION = 1
+
+KEY_PRESS = "k"
+KEY_RELEASE = "r"
+SPEED_CHANGE = "s"
+NEW_GAME = "n"
+THEME_CHANGE = "t"
+SEEK = "j"
+PLAY_PAUSE = "p"
+STEP = "m"
+RESET = "z"
+MANUAL_MODE = "u"
+END = "e"
+
+
+class SessionRecorder:
+    """Captures the input stream of a HanoiMainWindow with timestamps"""
+    
+    def __init__(self, window):
+        self.header = {
+            'version': LOG_VERSION,
+            'num_disks': window.num_disks,
+            'variant': window.variant,
+            'mode': window.mode,
+            'speed': window.speed_slider.value(),
+            'theme': window.theme_manager.get_current_theme(),
+            'size': [window.width(), window.height()],
+        }
+        self.events = []
+        self.start_time = time.perf_counter()
+        
+    def elapsed_ms(self):
+        """Milliseconds since recording started"""
+        return int((time.perf_counter() - self.start_time) * 1000)
+        
+    def record(self, kind, *args):
+        """Append one event to the log"""
+        self.events.append([self.elapsed_ms(), kind, *args])
+        
+    def record_key(self, event):
+        """Record a key press or release event"""
+        kind = KEY_PRESS if event.type() == QEvent.KeyPress else KEY_RELEASE
+        self.record(kind, int(event.key()), event.modifiers().value, int(event.isAutoRepeat()),
+                    event.timestamp())
+        
+    def stop(self):
+        """Mark the end of the recording so trailing autoplay is replayed"""
+        self.record(END)
+        
+    def to_dict(self):
+        """Return the log as a JSON-serialisable dict"""
+        log = dict(self.header)
+        log['events'] = self.events
+        return log
+        
+    def save(self, path):
+        """Write the log to a file"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+
+
+def load_session(path):
+    """Read a session log written by SessionRecorder.save"""
+    with open(path, 'r') as f:
+        log = json.load(f)
+    if log.get('version') != LOG_VERSION:
+        raise ValueError(f"Unsupported session log version: {log.get('version')}")
+    return log
+
+
+class SessionPlayer(QObject):
+    """Re-injects a recorded session into a HanoiMainWindow"""
+    
+    finished = Signal()
+    
+    def __init__(self, window, log, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.log = log
+        self.events = log['events']
+        self.next_event = 0
+        self.start_time = None
+        
+    def prepare_window(self):
+        """Put the window into the state it had when recording started"""
+        self.window.resize(*self.log.get('size', [1200, 800]))
+        self.window.set_theme(self.log.get('theme', self.window.theme_manager.LIGHT_THEME))
+        self.window.speed_slider.setValue(self.log.get('speed', 500))
+        self.window.start_game(self.log['num_disks'], self.log.get('variant', 'classic'),
+                               self.log.get('mode', 'eager'))
+                               
+    def play(self):
+        """Replay at the recorded pace; emits finished when done"""
+        self.prepare_window()
+        self.next_event = 0
+        self.start_time = time.perf_counter()
+        self._schedule_next()
+        
+    def _schedule_next(self):
+        if self.next_event >= len(self.events):
+            self.finished.emit()
+            return
+        due_ms = self.events[self.next_event][0]
+        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        QTimer.singleShot(max(0, int(due_ms - elapsed_ms)), self._play_next)
+        
+    def _play_next(self):
+        self.dispatch(self.events[self.next_event])
+        self.next_event += 1
+        self._schedule_next()
+        
+    def play_fast(self):
+        """Replay as fast as possible, blocking until done.
+        
+        The autoplay timer is replaced by a virtual clock: between two
+        events the widget is advanced by as many moves as its timer would
+        have produced in the recorded gap. Pending paints are flushed after
+        every event so paint cost is part of the measurement.
+        """
+        self.prepare_window()
+        app = QApplication.instance()
+        widget = self.window.hanoi_widget
+        last_time = 0
+        carry_ms = 0
+        
+        for event in self.events:
+            carry_ms += event[0] - last_time
+            last_time = event[0]
+            while widget.auto_play and carry_ms >= widget.animation_speed:
+                carry_ms -= widget.animation_speed
+                widget.next_move()
+                self.window.update_status_bar()
+                app.processEvents()
+            if not widget.auto_play:
+                carry_ms = 0
+                
+            self.dispatch(event)
+            widget.timer.stop()
+            widget.step_coalescer.flush()
+            app.processEvents()
+            
+        self.finished.emit()
+        
+    def dispatch(self, event):
+        """Apply a single recorded event to the window"""
+        kind = event[1]
+        if kind in (KEY_PRESS, KEY_RELEASE):
+            event_type = QEvent.KeyPress if kind == KEY_PRESS else QEvent.KeyRelease
+            auto_repeat = len(event) > 4 and bool(event[4])
+            key_event = QKeyEvent(event_type, event[2], Qt.KeyboardModifier(event[3]),
+                                  "", auto_repeat)
+            key_event.setTimestamp(event[5] if len(event) > 5 else event[0])
+            QApplication.sendEvent(self.window.hanoi_widget, key_event)
+        elif kind == SPEED_CHANGE:
+            self.window.speed_slider.setValue(event[2])
+        elif kind == NEW_GAME:
+            self.window.start_game(*event[2:])
+        elif kind == THEME_CHANGE:
+            self.window.set_theme(event[2])
+        elif kind == SEEK:
+            self.window.seek_to(event[2])
+        elif kind == PLAY_PAUSE:
+            self.window.toggle_playback()
+        elif kind == STEP:
+            if event[2] > 0:
+                self.window.step_forward()
+            else:
+                self.window.step_back()
+        elif kind == RESET:
+            self.window.reset_animation()
+        elif kind == MANUAL_MODE:
+            # Through the menu action, so its check mark follows
+            self.window.manual_mode_action.setChecked(bool(event[2]))
@@ -0,0 +1,67 @@
+"""
+Client side of the shared playback server (see solution_server.py).
+
+Wraps a QTcpSocket so the messages arrive as signals on the GUI thread;
+HanoiMainWindow uses it for its client mode.
+"""
+
+import json
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
+
+
+class SolutionClient(QObject):
+    """Line-delimited JSON connection to a SolutionServer"""
+    
+    # Full state: the snapshot message as a dict
+    snapshot_received = Signal(dict)
+    # One move: position delta (+1 or -1), source peg, target peg
+    move_received = Signal(int, str, str)
+    # Playback state: playing, speed in ms
+    state_received = Signal(bool, int)
+    connected = Signal()
+    disconnected = Signal()
+    error = Signal(str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.socket = QTcpSocket(self)
+        self.socket.readyRead.connect(self.read_messages)
+        self.socket.connected.connect(self.connected)
+        self.socket.disconnected.connect(self.disconnected)
+        self.socket.errorOccurred.connect(self.on_error)
+        
+    def connect_to(self, host, port):
+        self.socket.connectToHost(host, port)
+        
+    def disconnect_from_server(self):
+        self.socket.disconnectFromHost()
+        
+    def is_connected(self):
+        return self.socket.state() == QAbstractSocket.ConnectedState
+        
+    def send(self, message):
+        """Send one command, e.g. {"type": "seek", "move": 12}"""
+        if self.is_connected():
+            self.socket.write((json.dumps(message, separators=(',', ':')) + '\n').encode())
+            
+    def read_messages(self):
+        """Dispatch every complete line received so far"""
+        while self.socket.canReadLine():
+            line = bytes(self.socket.readLine())
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, list):
+                # Moves are the hot path, so they are sent as compact arrays
+                _, delta, pegs = message
+                self.move_received.emit(delta, pegs[0], pegs[1])
+            elif message.get('type') == 'snapshot':
+                self.snapshot_received.emit(message)
+            elif message.get('type') == 'state':
+                self.state_received.emit(message['playing'], message['speed'])
+                
+    def on_error(self, socket_error):
+        self.error.emit(self.socket.errorString())
@@ -0,0 +1,180 @@
+"""
+Sierpinski state graph view for the Towers of Hanoi visualization.
+
+The 3^n configurations of n disks form the Sierpinski graph: a state is a
+base-3 code (the peg of every disk) and its point in the triangle is
+sum(corner[peg of disk d] * 2^(d-1)) / (2^n - 1). Points are computed from
+the code whenever needed and never stored.
+
+The triangle itself is rendered once per depth and colour into a mipmap
+pyramid of QImages, and the panel draws the level closest to its size. This
+keeps the view smooth at 12+ disks, where the 3^n nodes cannot be drawn one
+by one; beyond MAX_DEPTH the extra detail is below pixel size anyway.
+"""
+
+import math
+
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QImage, QPainter, QPen, QBrush, QPolygonF
+
+from hanoi import PEGS
+
+
+SQRT3_2 = math.sqrt(3) / 2
+
+# Corners of the unit triangle: A bottom left, B on top, C bottom right,
+# so the classic solution runs along the bottom edge
+CORNERS = {'A': (0.0, SQRT3_2), 'B': (0.5, 0.0), 'C': (1.0, SQRT3_2)}
+
+# Deepest level drawn into the base image, and its width in pixels
+MAX_DEPTH = 8
+BASE_SIZE = 1024
+MIN_LEVEL_SIZE = 32
+
+# Solution path samples kept per solver
+PATH_SAMPLES = 512
+
+
+def state_point(positions):
+    """Return the (x, y) point of a configuration in the unit triangle"""
+    n = len(positions)
+    if n == 0:
+        return CORNERS['A']
+    x = y = 0.0
+    weight = 1
+    for peg in positions:
+        corner_x, corner_y = CORNERS[peg]
+        x += corner_x * weight
+        y += corner_y * weight
+        weight <<= 1
+    scale = 1 / ((1 << n) - 1)
+    return x * scale, y * scale
+
+
+def _code_positions(code, depth):
+    """Decode a base-3 state code into pegs, disk 1 first"""
+    positions = []
+    for _ in range(depth):
+        code, digit = divmod(code, 3)
+        positions.append(PEGS[digit])
+    return positions
+
+
+class StateGraphRenderer:
+    """Draws the state graph panel from a shared mipmap cache"""
+    
+    def __init__(self):
+        self._pyramids = {}
+        self._paths = {}
+        
+    def pyramid(self, num_disks, color):
+        """Return the mipmap levels (largest first) for a disk count and colour"""
+        depth = min(num_disks, MAX_DEPTH)
+        key = (depth, color.rgba())
+        levels = self._pyramids.get(key)
+        if levels is None:
+            levels = [self._render_base(depth, color)]
+            while levels[-1].width() // 2 >= MIN_LEVEL_SIZE:
+                previous = levels[-1]
+                levels.append(previous.scaled(previous.width() // 2, previous.height() // 2,
+                                              Qt.IgnoreAspectRatio, Qt.SmoothTransformation))
+            self._pyramids[key] = levels
+        return levels
+        
+    def _render_base(self, depth, color):
+        """Draw every edge of the depth-level graph into the base image"""
+        margin = 4
+        side = BASE_SIZE - 2 * margin
+        image = QImage(BASE_SIZE, int(side * SQRT3_2) + 2 * margin,
+                       QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        edge = side / max(1, (1 << depth) - 1)
+        painter.setPen(QPen(color, max(1.0, min(4.0, edge / 4))))
+        
+        def point(positions):
+            x, y = state_point(positions)
+            return QPointF(margin + x * side, margin + y * side)
+            
+        for code in range(3 ** depth):
+            positions = _code_positions(code, depth)
+            here = point(positions)
+            
+            # Disk 1 may move to either other peg
+            for peg in PEGS:
+                if peg != positions[0]:
+                    neighbour = [peg] + positions[1:]
+                    if PEGS.index(peg) > PEGS.index(positions[0]):
+                        painter.drawLine(here, point(neighbour))
+                        
+            # The one other move: the smaller top of the two remaining pegs
+            tops = {}
+            for disk in range(depth, 1, -1):
+                if positions[disk - 1] != positions[0]:
+                    tops[positions[disk - 1]] = disk
+            if tops:
+                disk = min(tops.values())
+                source = positions[disk - 1]
+                target = next(peg for peg in PEGS if peg not in (source, positions[0]))
+                if PEGS.index(target) > PEGS.index(source):
+                    neighbour = list(positions)
+                    neighbour[disk - 1] = target
+                    painter.drawLine(here, point(neighbour))
+        painter.end()
+        return image
+        
+    def solution_path(self, solver):
+        """Return [(move index, (x, y))] samples along the whole solution"""
+        key = (solver.variant, solver.num_disks)
+        path = self._paths.get(key)
+        if path is None:
+            total = solver.total_moves
+            step = max(1, total // PATH_SAMPLES)
+            indices = list(range(0, total, step)) + [total]
+            path = [(index, state_point(solver.state_at(index))) for index in indices]
+            self._paths[key] = path
+        return path
+        
+    def draw(self, painter, rect, num_disks, positions, solver, current_move,
+             graph_color, path_color, marker_color, show_path=True):
+        """Draw the graph, the traced solution path and the current state"""
+        side = min(rect.width(), rect.height() / SQRT3_2)
+        if side < 20:
+            return
+        origin_x = rect.x() + (rect.width() - side) / 2
+        origin_y = rect.y() + (rect.height() - side * SQRT3_2) / 2
+        
+        # Pick the smallest mipmap level that is still at least as large
+        levels = self.pyramid(num_disks, graph_color)
+        image = levels[0]
+        for level in levels:
+            if level.width() >= side:
+                image = level
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        margin = 4 * side / (BASE_SIZE - 8)
+        painter.drawImage(QRectF(origin_x - margin, origin_y - margin,
+                                 side + 2 * margin, side * SQRT3_2 + 2 * margin), image)
+                                 
+        def to_panel(point):
+            return QPointF(origin_x + point[0] * side, origin_y + point[1] * side)
+            
+        # Trace the solution up to the current move
+        if show_path and solver is not None and current_move > 0:
+            trace = QPolygonF()
+            for index, point in self.solution_path(solver):
+                if index > current_move:
+                    break
+                trace.append(to_panel(point))
+            trace.append(to_panel(state_point(positions)))
+            painter.setPen(QPen(path_color, 2))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPolyline(trace)
+            
+        # Current configuration
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QBrush(marker_color))
+        painter.drawEllipse(to_panel(state_point(positions)), 4, 4)
+        painter.restore()
@@ -1,13 +1,145 @@
 """
 Theme manager for the Towers of Hanoi application.
-Handles switching between light and dark themes.
+Handles switching between light and dark themes and user-defined themes.
+
+Each theme's stylesheet is read from disk and its QColor palette built only
+once; switching themes afterwards just swaps the cached objects.
+
+User themes are JSON files in the application's config "themes" directory
+(or loaded through View > Theme > Load Theme File...), for example:
+
+    {
+        "name": "solarized",
+        "label": "Solarized",
+        "stylesheet": "solarized.qss",
+        "colors": {"background": "#fdf6e3", "text": "#657b83",
+                   "tower": "#93a1a1", "keyword": "#268bd2",
+                   "disk_colors": ["#b58900", "#cb4b16", "#dc322f"]}
+    }
+
+The stylesheet path is relative to the JSON file and may be omitted.
 """
 
+import glob
+import json
 import os
-from PySide6.QtCore import QObject, Signal, QSettings
+from PySide6.QtCore import QObject, Signal, QSettings, QStandardPaths
+from PySide6.QtGui import QColor
 from PySide6.QtWidgets import QApplication
 
 
+DISK_COLORS = [
+    '#ff6b6b',  # Red
+    '#4ecdc4',  # Teal
+    '#45b7d1',  # Blue
+    '#f9ca24',  # Yellow
+    '#f0932b',  # Orange
+    '#eb4d4b',  # Dark Red
+    '#6c5ce7',  # Purple
+    '#a29bfe',  # Light Purple
+]
+
+LIGHT_COLORS = {
+    'background': '#ffffff',
+    'text': '#000000',
+    'tower': '#000000',
+    'keyword': '#0000ff',
+    'disk_colors': DISK_COLORS,
+}
+
+DARK_COLORS = {
+    'background': '#2b2b2b',
+    'text': '#ffffff',
+    'tower': '#666666',
+    'keyword': '#0000ff',
+    'disk_colors': DISK_COLORS,
+}
+
+
+def _check_theme_data(data):
+    """Raise ValueError unless data has the structure of a theme file"""
+    if not isinstance(data, dict):
+        raise ValueError("a theme file must hold a JSON object")
+    if not isinstance(data.get('name'), str) or not data['name']:
+        raise ValueError("'name' must be a non-empty string")
+    for key in ('label', 'stylesheet'):
+        if key in data and not isinstance(data[key], str):
+            raise ValueError(f"'{key}' must be a string")
+    colors = data.get('colors')
+    if not isinstance(colors, dict):
+        raise ValueError("'colors' must be an object")
+    for key, value in colors.items():
+        if key == 'disk_colors':
+            if not isinstance(value, list) or not all(isinstance(c, str) for c in value):
+                raise ValueError("'disk_colors' must be a list of color strings")
+            values = value
+        elif isinstance(value, str):
+            values = [value]
+        else:
+            raise ValueError(f"color '{key}' must be a string")
+        for color in values:
+            if not QColor.isValidColorName(color):
+                raise ValueError(f"invalid color {color!r} for '{key}'")
+
+
+class ThemePalette:
+    """QColor objects used for custom drawing, built once per theme"""
+    
+    _default = None
+    
+    @classmethod
+    def default(cls):
+        """Return the palette used by widgets without a theme manager"""
+        if cls._default is None:
+            cls._default = cls(LIGHT_COLORS)
+        return cls._default
+        
+    def __init__(self, colors):
+        self.background = QColor(colors['background'])
+        self.text = QColor(colors['text'])
+        self.tower = QColor(colors['tower'])
+        self.keyword = QColor(colors.get('keyword', LIGHT_COLORS['keyword']))
+        self.disk_colors = [QColor(c) for c in colors.get('disk_colors') or DISK_COLORS]
+
+
+class Theme:
+    """A named theme: drawing colors plus an optional stylesheet file"""
+    
+    def __init__(self, name, label, colors, stylesheet_path=None):
+        self.name = name
+        self.label = label
+        self.colors = colors
+        self.stylesheet_path = stylesheet_path
+        self._stylesheet = None
+        self._palette = None
+        
+    @property
+    def stylesheet(self):
+        """The stylesheet text, read from disk on first use"""
+        if self._stylesheet is None:
+            self._stylesheet = self._read_stylesheet()
+        return self._stylesheet
+        
+    @property
+    def palette(self):
+        """The ThemePalette for this theme, built on first use"""
+        if self._palette is None:
+            self._palette = ThemePalette(self.colors)
+        return self._palette
+        
+    def _read_stylesheet(self):
+        if not self.stylesheet_path:
+            return ""
+        try:
+            with open(self.stylesheet_path, 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            print(f"Warning: Theme file not found: {self.stylesheet_path}")
+        except Exception as e:
+            print(f"Error loading stylesheet: {e}")
+        return ""
+
+
 class ThemeManager(QObject):
     """Manages application themes and theme switching"""
     
@@ -19,11 +151,59 @@ class ThemeManager(QObject):
     def __init__(self):
         super().__init__()
         self.settings = QSettings()
+        self.themes = {}
+        self._applied_stylesheet = None
+        self.register_builtin_themes()
+        self.load_user_themes()
         self.current_theme = self.load_theme_preference()
         
+    def register_builtin_themes(self):
+        """Register the light and dark themes shipped in resources/"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        resources_dir = os.path.join(os.path.dirname(current_dir), 'resources')
+        self.register_theme(Theme(self.LIGHT_THEME, "Light", LIGHT_COLORS,
+                                  os.path.join(resources_dir, 'light_theme.qss')))
+        self.register_theme(Theme(self.DARK_THEME, "Dark", DARK_COLORS,
+                                  os.path.join(resources_dir, 'dark_theme.qss')))
+                                  
+    def register_theme(self, theme):
+        """Add a theme to the registry, replacing one with the same name"""
+        self.themes[theme.name] = theme
+        
+    def user_themes_dir(self):
+        """Directory scanned for user-defined theme files"""
+        config_dir = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+        return os.path.join(config_dir, 'themes')
+        
+    def load_user_themes(self):
+        """Register every theme file found in the user themes directory"""
+        for path in sorted(glob.glob(os.path.join(self.user_themes_dir(), '*.json'))):
+            try:
+                self.load_theme_file(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Could not load theme {path}: {e}")
+                
+    def load_theme_file(self, path):
+        """Load and register a JSON theme file, returning its name"""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        _check_theme_data(data)
+        
+        colors = dict(LIGHT_COLORS)
+        colors.update(data['colors'])
+        stylesheet_path = data.get('stylesheet')
+        if stylesheet_path:
+            stylesheet_path = os.path.join(os.path.dirname(os.path.abspath(path)),
+                                           stylesheet_path)
+                                           
+        name = data['name']
+        self.register_theme(Theme(name, data.get('label', name), colors, stylesheet_path))
+        return name
+        
     def load_theme_preference(self):
         """Load the saved theme preference"""
-        return self.settings.value("theme", self.LIGHT_THEME)
+        theme = self.settings.value("theme", self.LIGHT_THEME)
+        return theme if theme in self.themes else self.LIGHT_THEME
         
     def save_theme_preference(self, theme):
         """Save the theme preference"""
@@ -36,7 +216,7 @@ class ThemeManager(QObject):
         
     def set_theme(self, theme):
         """Set and apply a theme"""
-        if theme not in [self.LIGHT_THEME, self.DARK_THEME]:
+        if theme not in self.themes:
             raise ValueError(f"Invalid theme: {theme}")
             
         if theme != self.current_theme:
@@ -56,63 +236,21 @@ class ThemeManager(QObject):
         if app is None:
             return
             
-        stylesheet = self.load_stylesheet(self.current_theme)
-        app.setStyleSheet(stylesheet)
-        
+        # Restyling every widget is the expensive part, skip it when the
+        # stylesheet text did not change
+        stylesheet = self.themes[self.current_theme].stylesheet
+        if stylesheet != self._applied_stylesheet:
+            app.setStyleSheet(stylesheet)
+            self._applied_stylesheet = stylesheet
+            
     def load_stylesheet(self, theme):
         """Load the stylesheet for the given theme"""
-        try:
-            # Get the directory where this file is located
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            resources_dir = os.path.join(os.path.dirname(current_dir), 'resources')
-            
-            if theme == self.DARK_THEME:
-                style_path = os.path.join(resources_dir, 'dark_theme.qss')
-            else:
-                style_path = os.path.join(resources_dir, 'light_theme.qss')
-                
-            if os.path.exists(style_path):
-                with open(style_path, 'r') as f:
-                    return f.read()
-            else:
-                print(f"Warning: Theme file not found: {style_path}")
-                return ""
-                
-        except Exception as e:
-            print(f"Error loading stylesheet: {e}")
-            return ""
-            
+        return self.themes[theme].stylesheet
+        
     def get_theme_colors(self):
         """Get theme-specific colors for custom drawing"""
-        if self.current_theme == self.DARK_THEME:
-            return {
-                'background': '#2b2b2b',
-                'text': '#ffffff',
-                'tower': '#666666',
-                'disk_colors': [
-                    '#ff6b6b',  # Red
-                    '#4ecdc4',  # Teal
-                    '#45b7d1',  # Blue
-                    '#f9ca24',  # Yellow
-                    '#f0932b',  # Orange
-                    '#eb4d4b',  # Dark Red
-                    '#6c5ce7',  # Purple
-                    '#a29bfe',  # Light Purple
-                ]
-            }
-        else:
-            return {
-                'background': '#ffffff',
-                'text': '#000000',
-                'tower': '#000000',
-                'disk_colors': [
-                    '#ff6b6b',  # Red
-                    '#4ecdc4',  # Teal
-                    '#45b7d1',  # Blue
-                    '#f9ca24',  # Yellow
-                    '#f0932b',  # Orange
-                    '#eb4d4b',  # Dark Red
-                    '#6c5ce7',  # Purple
-                    '#a29bfe',  # Light Purple
-                ]
-            }
+        return self.themes[self.current_theme].colors
+        
+    def get_palette(self):
+        """Get the cached QColor palette of the current theme"""
+        return self.themes[self.current_theme].palette
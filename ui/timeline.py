@@ -0,0 +1,230 @@
+"""
+Timeline minimap for the Towers of Hanoi visualization.
+
+The strip shows the whole solution from left to right with one row per disk,
+the largest disk (the root call) on top, so the recursion shows up as depth
+bands: a row is lit wherever its disk moves. Clicking or dragging seeks, and
+hovering previews the move and configuration under the cursor.
+
+The strip is summarised into at most BASE_BUCKETS buckets of per-disk move
+counts, read from the solver's range queries rather than from the moves
+themselves, so building it costs the same at a thousand or a billion moves.
+Coarser levels are reduced from the finer ones by summing pairs of buckets,
+and each level is rendered to a small QImage the first time a strip of that
+width asks for it.
+"""
+
+from PySide6.QtWidgets import QWidget, QSizePolicy
+from PySide6.QtCore import Qt, QRectF, QPointF, Signal
+from PySide6.QtGui import QImage, QPainter, QPen, QBrush
+
+from hanoi import PEGS
+
+
+# Buckets of the finest level, and the coarsest level kept
+BASE_BUCKETS = 2048
+MIN_BUCKETS = 64
+
+
+class TimelineOverview:
+    """Per-disk move counts of one solution at several resolutions"""
+    
+    def __init__(self, solver):
+        self.num_disks = solver.num_disks
+        self.total_moves = solver.total_moves
+        
+        # Bucket i of the base level covers moves [bounds[i], bounds[i + 1])
+        buckets = min(self.total_moves, BASE_BUCKETS)
+        self.bounds = [i * self.total_moves // buckets for i in range(buckets + 1)] if buckets else [0]
+        
+        base = []
+        previous = [0] * self.num_disks
+        for stop in self.bounds[1:]:
+            prefix = solver.disk_move_counts(0, stop)
+            base.append([b - a for a, b in zip(previous, prefix)])
+            previous = prefix
+        self.levels = [base]
+        
+        # Reduce pairs of buckets until the strip is narrow enough
+        while len(self.levels[-1]) // 2 >= MIN_BUCKETS:
+            finer = self.levels[-1]
+            coarser = []
+            for i in range(0, len(finer) - 1, 2):
+                coarser.append([a + b for a, b in zip(finer[i], finer[i + 1])])
+            if len(finer) % 2:
+                coarser[-1] = [a + b for a, b in zip(coarser[-1], finer[-1])]
+            self.levels.append(coarser)
+        self._images = {}
+        
+    def level_for_width(self, width):
+        """Return the coarsest level that still has a bucket per pixel"""
+        chosen = 0
+        for index, level in enumerate(self.levels):
+            if len(level) >= width:
+                chosen = index
+        return chosen
+        
+    def image(self, level, disk_colors):
+        """Return the level drawn one pixel per bucket and per disk"""
+        key = (level, tuple(color.rgba() for color in disk_colors))
+        image = self._images.get(key)
+        if image is None:
+            image = self._render(self.levels[level], disk_colors)
+            self._images[key] = image
+        return image
+        
+    def _render(self, buckets, disk_colors):
+        width, height = max(1, len(buckets)), max(1, self.num_disks)
+        pixels = bytearray(width * height * 4)
+        for disk in range(1, self.num_disks + 1):
+            color = disk_colors[(disk - 1) % len(disk_colors)]
+            # Format_ARGB32 is stored as BGRA bytes on little endian hosts
+            pixel = bytes((color.blue(), color.green(), color.red(), 255))
+            row = (self.num_disks - disk) * width
+            for x, counts in enumerate(buckets):
+                if counts[disk - 1]:
+                    offset = (row + x) * 4
+                    pixels[offset:offset + 4] = pixel
+        return QImage(bytes(pixels), width, height, width * 4, QImage.Format_ARGB32).copy()
+
+
+class TimelineRenderer:
+    """Builds and caches timeline overviews, shared between widgets"""
+    
+    MAX_OVERVIEWS = 16
+    
+    def __init__(self):
+        self._overviews = {}
+        
+    def overview(self, solver):
+        """Return the overview of a solver's solution"""
+        key = (solver.variant, solver.num_disks)
+        overview = self._overviews.get(key)
+        if overview is None:
+            if len(self._overviews) >= self.MAX_OVERVIEWS:
+                self._overviews.pop(next(iter(self._overviews)))
+            overview = TimelineOverview(solver)
+            self._overviews[key] = overview
+        return overview
+
+
+class TimelineMinimap(QWidget):
+    """Strip under a HanoiWidget showing the whole solution at a glance"""
+    
+    # Emitted with the move index the user clicked or dragged to (object,
+    # as indices can pass the C int range)
+    seek_requested = Signal(object)
+    
+    STRIP_HEIGHT = 72
+    PREVIEW_WIDTH = 150
+    
+    def __init__(self, hanoi_widget, parent=None):
+        super().__init__(parent)
+        self.hanoi_widget = hanoi_widget
+        self.renderer = hanoi_widget.render_cache.timeline
+        self.hover_index = None
+        
+        self.setFixedHeight(self.STRIP_HEIGHT)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMouseTracking(True)
+        self.setToolTip("Click or drag to jump to a move")
+        
+        hanoi_widget.move_changed.connect(self.update)
+        
+    def strip_rect(self):
+        """Area covered by the disk rows"""
+        return QRectF(4, 4, self.width() - 8, self.height() - 8)
+        
+    def index_at(self, x):
+        """Return the move index under an x coordinate"""
+        rect = self.strip_rect()
+        total = self.hanoi_widget.solver.total_moves
+        fraction = min(1.0, max(0.0, (x - rect.x()) / max(1.0, rect.width())))
+        return round(fraction * total)
+        
+    def x_of(self, index):
+        """Return the x coordinate of a move index"""
+        rect = self.strip_rect()
+        total = max(1, self.hanoi_widget.solver.total_moves)
+        return rect.x() + rect.width() * index / total
+        
+    def paintEvent(self, event):
+        """Draw the rows, the current position and the hover preview"""
+        widget = self.hanoi_widget
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), widget.bg_color)
+        
+        rect = self.strip_rect()
+        if widget.num_disks > 0 and widget.solver.total_moves > 0:
+            overview = self.renderer.overview(widget.solver)
+            level = overview.level_for_width(int(rect.width()))
+            painter.drawImage(rect, overview.image(level, widget.disk_colors))
+            
+        painter.setPen(QPen(widget.tower_color, 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(rect)
+        
+        # Current position
+        x = self.x_of(widget.current_move)
+        painter.setPen(QPen(widget.text_color, 2))
+        painter.drawLine(QPointF(x, 0), QPointF(x, self.height()))
+        
+        if self.hover_index is not None and not widget.manual_mode:
+            self.draw_preview(painter, self.hover_index)
+        painter.end()
+        
+    def draw_preview(self, painter, index):
+        """Draw the move and the configuration at index next to the cursor"""
+        widget = self.hanoi_widget
+        solver = widget.solver
+        x = self.x_of(index)
+        painter.setPen(QPen(widget.text_color, 1, Qt.DashLine))
+        painter.drawLine(QPointF(x, 0), QPointF(x, self.height()))
+        
+        # Keep the box inside the strip, on the side with more room
+        box_x = x + 8 if x + 8 + self.PREVIEW_WIDTH <= self.width() else x - 8 - self.PREVIEW_WIDTH
+        box = QRectF(max(0, box_x), 2, self.PREVIEW_WIDTH, self.height() - 4)
+        painter.setPen(QPen(widget.tower_color, 1))
+        painter.setBrush(QBrush(widget.bg_color))
+        painter.drawRect(box)
+        
+        if index < solver.total_moves:
+            source, target, disk = solver.move_at(index)
+            caption = f"{index}: disk {disk} {source}→{target}"
+        else:
+            caption = f"{index}: solved"
+        painter.setFont(widget.render_cache.code_font)
+        painter.setPen(widget.text_color)
+        painter.drawText(box.adjusted(4, 2, -4, 0), Qt.AlignLeft | Qt.AlignTop, caption)
+        
+        # Miniature towers of state_at(index), O(n) at any index
+        positions = solver.state_at(index)
+        area = box.adjusted(4, 20, -4, -4)
+        peg_width = area.width() / 3
+        disk_height = min(4.0, area.height() / max(1, widget.num_disks))
+        heights = dict.fromkeys(PEGS, 0)
+        for disk in range(widget.num_disks, 0, -1):
+            peg = positions[disk - 1]
+            width = peg_width * (0.25 + 0.7 * disk / widget.num_disks)
+            center = area.x() + peg_width * (PEGS.index(peg) + 0.5)
+            y = area.bottom() - (heights[peg] + 1) * disk_height
+            heights[peg] += 1
+            painter.fillRect(QRectF(center - width / 2, y, width, max(1.0, disk_height - 1)),
+                             widget.disk_colors[(disk - 1) % len(widget.disk_colors)])
+                             
+    def mousePressEvent(self, event):
+        """Seek to the clicked move"""
+        if event.button() == Qt.LeftButton:
+            self.seek_requested.emit(self.index_at(event.position().x()))
+            
+    def mouseMoveEvent(self, event):
+        """Update the hover preview, and keep seeking while dragging"""
+        self.hover_index = self.index_at(event.position().x())
+        if event.buttons() & Qt.LeftButton:
+            self.seek_requested.emit(self.hover_index)
+        self.update()
+        
+    def leaveEvent(self, event):
+        """Hide the hover preview"""
+        self.hover_index = None
+        self.update()